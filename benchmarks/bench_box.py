@@ -0,0 +1,37 @@
+import numpy as np
+
+from common import main
+from pyece.box import Box, Point, Size, area_intersection, area_union
+
+
+def random_boxes(count: int, dim: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    anchors = rng.integers(0, 50, (count, dim)).tolist()
+    sides = rng.integers(1, 20, (count, dim)).tolist()
+    return [Box(a, s, [100] * dim) for a, s in zip(anchors, sides)]
+
+
+def scenarios():
+    point, size = Point(1.0, 2.0, 3.0), Size(4.0, 5.0, 6.0)
+    box = random_boxes(1, 3)[0]
+    yield 'box: Point hash+eq', lambda: (hash(point), point == (1.0, 2.0, 3.0))
+    yield 'box: Size hash+eq', lambda: (hash(size), size == (4.0, 5.0, 6.0))
+    yield 'box: Box hash+eq', lambda: (hash(box), box == box)
+    for count, dim in [(10, 2), (30, 2), (8, 3)]:
+        boxes = random_boxes(count, dim)
+        yield f'box: area_union split {count}x{dim}D', lambda b=boxes: area_union(*b, engine='split')
+        groups = boxes[::2], boxes[1::2]
+        yield f'box: area_intersection split {count}x{dim}D', lambda g=groups: area_intersection(*g, engine='split')
+    for count, dim in [(100, 2), (1000, 2), (100, 3), (60, 4)]:
+        boxes = random_boxes(count, dim)
+        yield f'box: area_union auto {count}x{dim}D', lambda b=boxes: area_union(*b)
+        groups = boxes[::2], boxes[1::2]
+        yield f'box: area_intersection auto {count}x{dim}D', lambda g=groups: area_intersection(*g)
+    box = Box([0.0] * 3, [100.0] * 3, [100.0] * 3)
+    for cuts in [1, 5, 20]:
+        points = np.random.default_rng(cuts).uniform(0, 100, (cuts, 3)).tolist()
+        yield f'box: Box.split {cuts} cuts 3D', lambda p=points: box.split(*p)
+
+
+if __name__ == '__main__':
+    main(scenarios)
@@ -0,0 +1,46 @@
+import os
+import tempfile
+
+import h5py
+import numpy as np
+
+from common import main
+from pyece import Corners
+from pyece.im import ByPatchWrapper, ThreadExecutor, cutpatch, meshcorners
+
+
+def scenarios():
+    rng = np.random.default_rng(0)
+    volumes = {2: rng.normal(size=(512, 512)).astype(np.float32), 3: rng.normal(size=(128, 128, 128)).astype(np.float32)}
+    for dim, grid in [(2, 64), (2, 256), (3, 32), (3, 64)]:
+        corners = Corners.product((grid * 1.5,) * dim).value + 10.3
+        yield f'im: meshcorners {dim}D {grid}^{dim}', lambda c=corners, g=(grid,) * dim: meshcorners(c, g)
+        for order in [0, 1]:
+            yield (
+                f'im: cutpatch ndarray {dim}D {grid}^{dim} order {order}',
+                lambda c=corners, g=(grid,) * dim, o=order, v=volumes[dim]: cutpatch(v, c, g, order=o),
+            )
+    with tempfile.TemporaryDirectory() as root:
+        with h5py.File(os.path.join(root, 'volume.h5'), 'w') as file:
+            dataset = file.create_dataset('data', data=volumes[3], chunks=(32, 32, 32))
+            for grid in [32, 64]:
+                corners = Corners.product((grid,) * 3).value + 40
+                yield f'im: cutpatch h5 3D {grid}^3', lambda c=corners, g=(grid,) * 3: cutpatch(dataset, c, g)
+                yield (
+                    f'im: cutpatch h5 chunked 3D {grid}^3',
+                    lambda c=corners, g=(grid,) * 3: cutpatch(dataset, c, g, chunked=True),
+                )
+
+    volume = volumes[3]
+    sequential = ByPatchWrapper(np.mean, (32, 32, 32), grid=(6, 6, 6))
+    threaded = ByPatchWrapper(np.mean, (32, 32, 32), grid=(6, 6, 6), executor=ThreadExecutor(workers=4))
+    stitching = ByPatchWrapper(lambda patch: patch * 2, (32, 32, 32), grid=(5, 5, 5))
+    resampling = ByPatchWrapper(np.mean, (32, 32, 32), spacing=(1.5, 1.5, 1.5), lazy=True)
+    yield 'im: ByPatchWrapper 128^3 6^3 patches', lambda: sequential(volume)
+    yield 'im: ByPatchWrapper threads 128^3 6^3 patches', lambda: threaded(volume)
+    yield 'im: ByPatchWrapper.stitch 128^3 5^3 patches', lambda: stitching.stitch(volume)
+    yield 'im: ByPatchWrapper lazy resample 128^3', lambda: resampling(volume)
+
+
+if __name__ == '__main__':
+    main(scenarios)
@@ -0,0 +1,31 @@
+import numpy as np
+
+from common import main
+from pyece.core.property import (
+    Corners,
+    Point,
+    PointCloud,
+    PointInflation,
+    PointRotate,
+    PointShift,
+    RandomUniform,
+    Transformer,
+)
+
+
+def scenarios():
+    chain = Transformer(
+        PointRotate(Point([RandomUniform(-0.5, 0.5) for _ in range(3)])),
+        PointInflation(RandomUniform(0.8, 1.2)),
+        PointShift(Point([RandomUniform(-5, 5) for _ in range(3)])),
+    )
+    for count in [8, 1000, 100000]:
+        cloud = PointCloud(np.random.default_rng(count).normal(size=(count, 3)))
+        yield f'property: PointCloud rotate {count} points', lambda c=cloud: c.transform(PointRotate((0.1, 0.2, 0.3))).value
+        yield f'property: Transformer chain {count} points', lambda c=cloud: chain(c).value
+    corners = Corners.product((64, 64, 64))
+    yield 'property: Transformer.sample 1000 corners', lambda: chain.sample(corners, 1000)
+
+
+if __name__ == '__main__':
+    main(scenarios)
@@ -0,0 +1,73 @@
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# NOTE: every bench module imports common first, so the checkout is found
+# whether it runs standalone or through run.py
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+Scenario = Tuple[str, Callable[[], object]]
+Results = Dict[str, Dict[str, float]]
+
+
+def measure(fn: Callable[[], object], repeat: int = 5) -> Dict[str, float]:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return dict(best=min(times), median=statistics.median(times), number=number)
+
+
+def run(scenarios: Iterable[Scenario], repeat: int = 5, pattern: Optional[str] = None) -> Results:
+    # NOTE: scenarios are generators, they may hold files open while timed
+    results: Results = dict()
+    for name, fn in scenarios:
+        if pattern is not None and not re.search(pattern, name):
+            continue
+        results[name] = stats = measure(fn, repeat=repeat)
+        print(f'{name:<48} {stats["best"] * 1e6:14.1f} us')
+    return results
+
+
+def save(path: str, results: Results) -> None:
+    meta = dict(
+        created=time.strftime('%Y-%m-%dT%H:%M:%S'),
+        python=platform.python_version(),
+        numpy=np.__version__,
+        machine=platform.machine(),
+    )
+    with open(path, 'w') as file:
+        json.dump(dict(meta=meta, results=results), file, indent=2, sort_keys=True)
+
+
+def load(path: str) -> Results:
+    with open(path) as file:
+        return json.load(file)['results']
+
+
+def compare(results: Results, baseline: Results, tolerance: float = 0.25) -> List[str]:
+    # NOTE: best times are compared, slower than (1 + tolerance) x baseline fails
+    regressions = list()
+    for name in sorted(set(results) & set(baseline)):
+        ratio = results[name]['best'] / baseline[name]['best']
+        mark = 'REGRESSION' if ratio > 1 + tolerance else ('faster' if ratio < 1 - tolerance else '')
+        print(f'{name:<48} {ratio:8.2f}x {mark}')
+        if mark == 'REGRESSION':
+            regressions.append(name)
+    missing = len(set(baseline) - set(results))
+    if missing:
+        print(f'{missing} baseline scenarios were not run')
+    return regressions
+
+
+def main(scenarios: Callable[[], Iterable[Scenario]], repeat: int = 5) -> None:
+    run(scenarios(), repeat=repeat)
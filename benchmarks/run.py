@@ -0,0 +1,42 @@
+"""Offline benchmark suite.
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline results.json --tolerance 0.25
+"""
+import argparse
+import importlib
+import itertools
+import sys
+
+import common
+
+SUITES = ('box', 'im', 'property')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('suites', nargs='*', help='any of {}, all by default'.format(', '.join(SUITES)))
+    parser.add_argument('-k', dest='pattern', help='run only scenarios matching this regex')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='save results as json')
+    parser.add_argument('--baseline', help='compare against saved results')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args()
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error('unknown suites: {}'.format(', '.join(sorted(unknown))))
+
+    scenarios = itertools.chain.from_iterable(
+        importlib.import_module(f'bench_{suite}').scenarios() for suite in args.suites or SUITES
+    )
+    results = common.run(scenarios, repeat=args.repeat, pattern=args.pattern)
+    if args.output:
+        common.save(args.output, results)
+    if args.baseline:
+        regressions = common.compare(results, common.load(args.baseline), tolerance=args.tolerance)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1 +1,16 @@
 from .core import *
+
+# NOTE: pyece.box and pyece.im are imported on first attribute access
+_LAZY = ("box", "im")
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
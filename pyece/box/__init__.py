@@ -0,0 +1,8 @@
+from .base import *
+from .array import *
+from .area import *
+from .area import map_box_groups
+from .union import *
+from .overlap import *
+from .nms import *
+from .index import *
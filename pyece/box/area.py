@@ -0,0 +1,110 @@
+__all__ = [
+    'area_union',
+    'area_intersection',
+]
+
+from collections.abc import Iterable
+from typing import Dict, List
+
+import numpy as np
+
+from .array import BoxArray
+from .base import Box
+from .union import (
+    GRID_CELLS,
+    _grid_cells,
+    grid_intersection_area,
+    grid_union_area,
+    sweep_intersection_area,
+    sweep_union_area,
+)
+
+ENGINES = ('auto', 'sweep', 'grid', 'split')
+
+
+def _unpack_boxes(*boxes) -> List[Box]:
+    result = list()
+    for box in boxes:
+        if isinstance(box, Box):
+            result.append(box)
+        elif isinstance(box, Iterable):
+            result.extend(box)
+        else:
+            raise NotImplementedError
+    return result
+
+def _bounds(*boxes) -> np.ndarray:
+    arrays = [box for box in boxes if isinstance(box, BoxArray)]
+    rest = _unpack_boxes(*[box for box in boxes if not isinstance(box, BoxArray)])
+    if rest:
+        arrays.append(BoxArray.from_boxes(rest))
+    assert len(set(array.canvas for array in arrays)) == 1
+    return np.concatenate([array.bounds for array in arrays])
+
+def area_union(*boxes: Box, engine: str = 'auto') -> float:
+    assert engine in ENGINES
+    if engine == 'split':
+        return _area_union_split(*_unpack_boxes(*boxes))
+    bounds = _bounds(*boxes)
+    if engine == 'auto':
+        # NOTE: past GRID_CELLS the sweep bounds memory by slabs along axis 0
+        large = bounds.shape[-1] == 2 or _grid_cells(bounds) > GRID_CELLS
+        engine = 'sweep' if large else 'grid'
+    if engine == 'sweep':
+        return sweep_union_area(bounds)
+    return grid_union_area(bounds)
+
+def _split_rows(array: BoxArray, cuts: np.ndarray) -> np.ndarray:
+    data = array.split(cuts).data
+    return np.unique(data.reshape(len(data), -1), axis=0)
+
+def _rows_area(rows: np.ndarray, canvas: np.ndarray) -> float:
+    sides = rows[:, len(canvas):] * canvas
+    return np.sum(np.prod(sides, axis=1))
+
+def _area_union_split(*boxes: Box) -> float:
+    assert len(set(box.canvas for box in boxes)) == 1
+    array = BoxArray.from_boxes(boxes)
+    cuts = array.bounds.reshape(-1, array.ndim)
+    return _rows_area(_split_rows(array, cuts), array._c)
+
+def map_box_groups(*box_groups: List[Box]) -> Dict[int, List[Box]]:
+    groups = {i: list() for i in range(len(box_groups))}
+    for i, group in enumerate(box_groups):
+        if isinstance(group, Iterable):
+            for box in group:
+                assert isinstance(box, Box)
+                groups[i].append(box)
+        elif isinstance(group, Box):
+            groups[i].append(group)
+        else:
+            raise NotImplementedError
+    assert len(set(box.canvas for group in groups.values() for box in group))
+    return groups
+
+def _is_empty(group) -> bool:
+    if isinstance(group, BoxArray):
+        return len(group) == 0
+    if isinstance(group, Box):
+        return False
+    return all(_is_empty(box) for box in group)
+
+def area_intersection(*box_groups: List[Box], engine: str = 'auto') -> float:
+    assert engine in ENGINES
+    if engine != 'split':
+        if any(_is_empty(group) for group in box_groups):
+            return 0.0
+        bounds = [_bounds(group) for group in box_groups]
+        if engine == 'auto':
+            engine = 'sweep' if _grid_cells(*bounds) > GRID_CELLS else 'grid'
+        if engine == 'sweep':
+            return sweep_intersection_area(*bounds)
+        return grid_intersection_area(*bounds)
+    groups = map_box_groups(*box_groups)
+    if any(len(group) == 0 for group in groups.values()):
+        return 0.0
+    arrays = [BoxArray.from_boxes(group) for group in groups.values()]
+    cuts = np.concatenate([array.bounds.reshape(-1, array.ndim) for array in arrays])
+    rows = np.concatenate([_split_rows(array, cuts) for array in arrays])
+    rows, counts = np.unique(rows, axis=0, return_counts=True)
+    return _rows_area(rows[counts == len(arrays)], arrays[0]._c)
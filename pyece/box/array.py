@@ -0,0 +1,158 @@
+__all__ = [
+    'BoxArray',
+    'as_boxarray',
+    'as_bounds',
+]
+
+from collections.abc import Iterable
+from typing import Iterator, List, Union
+
+import numpy as np
+
+from .base import Box, Size
+from .split import split_bounds
+
+AnyBoxes = Union['BoxArray', Box, Iterable]
+
+
+# NOTE: like Box, coords are stored relative to the canvas:
+# data[:, 0] holds anchors and data[:, 1] holds sides
+class BoxArray:
+    def __init__(self, anchors, sides, canvas):
+        canvas = np.asarray(canvas, dtype=float).reshape(-1)
+        anchors = np.asarray(anchors, dtype=float).reshape(-1, len(canvas))
+        sides = np.asarray(sides, dtype=float).reshape(-1, len(canvas))
+        assert anchors.shape == sides.shape
+        # NOTE: same normalization as Box.sides for negative sides
+        anchors = anchors + np.minimum(sides, 0)
+        sides = np.abs(sides)
+        data = np.stack([anchors, sides], axis=1) / canvas
+        self._set(data, canvas)
+
+    def _set(self, data: np.ndarray, canvas: np.ndarray) -> None:
+        self._data = np.ascontiguousarray(data, dtype=float)
+        self._c = canvas
+
+    @classmethod
+    def _from_relative(cls, data, canvas) -> 'BoxArray':
+        boxes = cls.__new__(cls)
+        canvas = np.asarray(canvas, dtype=float).reshape(-1)
+        data = np.asarray(data, dtype=float).reshape(-1, 2, len(canvas))
+        boxes._set(data, canvas)
+        return boxes
+
+    @classmethod
+    def from_bounds(cls, anchors, distants, canvas) -> 'BoxArray':
+        anchors = np.asarray(anchors, dtype=float)
+        return cls(anchors, np.asarray(distants, dtype=float) - anchors, canvas)
+
+    @classmethod
+    def from_boxes(cls, boxes: Iterable) -> 'BoxArray':
+        boxes = list(boxes)
+        assert len(boxes) > 0
+        canvas = boxes[0].canvas
+        assert all(box.canvas == canvas for box in boxes)
+        data = [[box._a, box._s] for box in boxes]
+        return cls._from_relative(data, canvas.numpy())
+
+    def to_boxes(self) -> List[Box]:
+        return list(self)
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._data
+
+    @property
+    def ndim(self) -> int:
+        return self._data.shape[-1]
+
+    @property
+    def canvas(self) -> Size:
+        return Size(self._c)
+
+    @canvas.setter
+    def canvas(self, other) -> None:
+        canvas = np.asarray(other, dtype=float).reshape(-1)
+        assert len(canvas) == self.ndim
+        self._c = canvas
+
+    @property
+    def anchor(self) -> np.ndarray:
+        return self._data[:, 0] * self._c
+
+    @property
+    def sides(self) -> np.ndarray:
+        return self._data[:, 1] * self._c
+
+    @property
+    def distant(self) -> np.ndarray:
+        return self.anchor + self.sides
+
+    @property
+    def centre(self) -> np.ndarray:
+        return (self.anchor + self.distant) / 2
+
+    @property
+    def area(self) -> np.ndarray:
+        return np.prod(self.sides, axis=-1)
+
+    @property
+    def bounds(self) -> np.ndarray:
+        return np.stack([self.anchor, self.distant], axis=1)
+
+    def numpy(self) -> np.ndarray:
+        return self._data * self._c
+
+    def split(self, *points) -> 'BoxArray':
+        cuts = np.concatenate([np.reshape(p, (-1, self.ndim)) for p in points]) \
+            if points else np.empty((0, self.ndim))
+        sub, _ = split_bounds(self.bounds, cuts)
+        data = np.stack([sub[:, 0], sub[:, 1] - sub[:, 0]], axis=1) / self._c
+        return BoxArray._from_relative(data, self._c)
+
+    def contains(self, points) -> np.ndarray:
+        points = np.asarray(points, dtype=float)
+        single = points.ndim == 1
+        points = points.reshape(-1, 1, self.ndim)
+        p1 = self.anchor
+        p2 = self.distant
+        inside = ((p1 < points) & (points < p2)).all(-1).T
+        return inside[:, 0] if single else inside
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, i) -> Union[Box, 'BoxArray']:
+        if isinstance(i, (int, np.integer)):
+            anchor, sides = self._data[i]
+            return Box._from_relative(anchor, sides, self._c)
+        return BoxArray._from_relative(self._data[i], self._c)
+
+    def __iter__(self) -> Iterator[Box]:
+        for anchor, sides in self._data:
+            yield Box._from_relative(anchor, sides, self._c)
+
+    def __repr__(self) -> str:
+        return 'BoxArray[{} x {}D on {}]'.format(len(self), self.ndim, repr(self.canvas.sides))
+
+
+def as_boxarray(boxes: AnyBoxes) -> BoxArray:
+    if isinstance(boxes, BoxArray):
+        return boxes
+    if isinstance(boxes, Box):
+        boxes = [boxes]
+    return BoxArray.from_boxes(boxes)
+
+
+def as_bounds(boxes) -> np.ndarray:
+    if isinstance(boxes, BoxArray):
+        return boxes.bounds
+    if isinstance(boxes, Box):
+        return as_boxarray(boxes).bounds
+    if isinstance(boxes, Iterable) and not isinstance(boxes, np.ndarray):
+        boxes = list(boxes)
+        if boxes and all(isinstance(box, Box) for box in boxes):
+            return as_boxarray(boxes).bounds
+    bounds = np.asarray(boxes, dtype=float)
+    assert bounds.ndim == 3 and bounds.shape[1] == 2
+    return bounds
@@ -0,0 +1,290 @@
+__all__ = [
+    'Point',
+    'Size',
+    'Box',
+]
+
+from collections.abc import Iterable
+from typing import Iterator, List, Tuple, Union
+
+import numpy as np
+
+from .split import split_bounds
+
+Number = (int, float, complex)
+AnyPoint = Union[Tuple[Union[int, float, complex], ...], 'Point']
+AnySize = Union[Tuple[Union[int, float, complex], ...], 'Size']
+
+def _isscalar(value) -> bool:
+    if isinstance(value, Number):
+        return True
+    if isinstance(value, (tuple, list, np.ndarray, Point, Size)):
+        return False
+    return np.isscalar(value)
+
+def _as_numpy(fn):
+    def wrapper(self, other):
+        return Point._make(tuple(fn(self.numpy(), Point(other).numpy()).tolist()))
+    return wrapper
+
+
+# NOTE: Point, Size and Box are immutable tuple-backed values with a cached
+# hash, they are used as set keys on the area_union/area_intersection paths
+class Point:
+    __slots__ = ('_coords', '_hash')
+
+    def __init__(self, *coords: AnyPoint):
+        if len(coords) == 1:
+            coords = coords[0]
+            if _isscalar(coords):
+                coords = (coords,)
+            elif isinstance(coords, Point):
+                coords = coords._coords
+            elif isinstance(coords, Iterable):
+                coords = Point(*coords)._coords
+            else:
+                raise NotImplementedError
+        self._coords = tuple(
+            p if _isscalar(p) else Point(p)
+            for p in coords
+        )
+        self._hash = None
+
+    @classmethod
+    def _make(cls, coords: tuple) -> 'Point':
+        point = object.__new__(cls)
+        point._coords = coords
+        point._hash = None
+        return point
+
+    @property
+    def coords(self) -> tuple:
+        return self._coords
+
+    def numpy(self) -> np.ndarray:
+        return np.asarray(self._coords, dtype=float)
+
+    def __len__(self):
+        return len(self._coords)
+
+    def __getitem__(self, i) -> 'Point':
+        return self._coords[i]
+
+    def __iter__(self):
+        return iter(self._coords)
+
+    def __repr__(self) -> str:
+        return 'Point[{}]'.format(', '.join([*map(repr, self._coords)]))
+
+    def __eq__(self, other: 'Point') -> bool:
+        if isinstance(other, (tuple, list)) and len(other) != 1:
+            return self._coords == tuple(other)
+        if not isinstance(other, Point):
+            other = Point(other)
+        return self._coords == other._coords
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._coords)
+        return self._hash
+
+    @_as_numpy
+    def __add__(self, other):
+        return self + other
+
+    @_as_numpy
+    def __sub__(self, other):
+        return self - other
+
+    @_as_numpy
+    def __mul__(self, other):
+        return self * other
+
+    @_as_numpy
+    def __truediv__(self, other):
+        return self / other
+
+    @_as_numpy
+    def __radd__(self, other):
+        return self + other
+
+    @_as_numpy
+    def __rsub__(self, other):
+        return self - other
+
+    @_as_numpy
+    def __rmul__(self, other):
+        return self * other
+
+    @_as_numpy
+    def __rtruediv__(self, other):
+        return self / other
+
+class Size:
+    __slots__ = ('_sides', '_hash')
+
+    def __init__(self, *sides: AnySize):
+        if len(sides) == 1:
+            sides = sides[0]
+            if _isscalar(sides):
+                sides = (sides,)
+            elif isinstance(sides, Size):
+                sides = sides._sides
+            elif isinstance(sides, Iterable):
+                sides = Size(*sides)._sides
+            else:
+                raise NotImplementedError
+        if not all([_isscalar(s) for s in sides]):
+            raise NotImplementedError
+        self._sides = tuple(sides)
+        self._hash = None
+
+    @classmethod
+    def _make(cls, sides: tuple) -> 'Size':
+        size = object.__new__(cls)
+        size._sides = sides
+        size._hash = None
+        return size
+
+    @property
+    def sides(self) -> tuple:
+        return self._sides
+
+    def numpy(self) -> np.ndarray:
+        return np.asarray(self._sides, dtype=float)
+
+    def __len__(self):
+        return len(self._sides)
+
+    def __getitem__(self, i) -> 'Size':
+        return self._sides[i]
+
+    def __iter__(self):
+        return iter(self._sides)
+
+    def __eq__(self, other):
+        if isinstance(other, (tuple, list)) and len(other) != 1:
+            return self._sides == tuple(other)
+        if not isinstance(other, Size):
+            other = Size(other)
+        return self._sides == other._sides
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'Size[{}]'.format(', '.join([*map(repr, self._sides)]))
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._sides)
+        return self._hash
+
+
+class Box:
+    __slots__ = ('_c', '_a', '_s', '_hash')
+
+    def __init__(self, anchor: AnyPoint, sides: AnySize, canvas: AnySize):
+        canvas = Size(canvas)
+        anchor = Point(anchor)
+        sides = Point(sides)
+        assert len(anchor) == len(canvas)
+        assert len(sides) == len(canvas)
+        # NOTE: negative sides flip the box so that sides are non-negative
+        anchor = [a + s if s < 0 else a for a, s in zip(anchor, sides)]
+        sides = [-1 * s if s < 0 else s for s in sides]
+        self._init(
+            tuple(a / c for a, c in zip(anchor, canvas)),
+            tuple(s / c for s, c in zip(sides, canvas)),
+            canvas,
+        )
+
+    def _init(self, anchor: tuple, sides: tuple, canvas: Size) -> None:
+        self._c = canvas
+        self._a = anchor
+        self._s = sides
+        self._hash = None
+
+    def __len__(self):
+        return len(self._c)
+
+    @classmethod
+    def _make(cls, anchor: tuple, sides: tuple, canvas: Size) -> 'Box':
+        box = object.__new__(cls)
+        box._init(anchor, sides, canvas)
+        return box
+
+    @classmethod
+    def _from_relative(cls, anchor, sides, canvas) -> 'Box':
+        # NOTE: skips the canvas round trip to keep relative coords bit-exact
+        return cls._make(
+            tuple(np.asarray(anchor, dtype=float).tolist()),
+            tuple(np.asarray(sides, dtype=float).tolist()),
+            Size(canvas),
+        )
+
+    @property
+    def anchor(self) -> Point:
+        return Point._make(tuple(a * c for a, c in zip(self._a, self._c)))
+
+    @property
+    def sides(self) -> Size:
+        return Size._make(tuple(s * c for s, c in zip(self._s, self._c)))
+
+    @property
+    def distant(self) -> Point:
+        return Point._make(tuple(
+            a * c + s * c for a, s, c in zip(self._a, self._s, self._c)
+        ))
+
+    @property
+    def centre(self) -> Point:
+        return (self.anchor + self.distant) / 2
+
+    @property
+    def canvas(self) -> Size:
+        return self._c
+
+    def __repr__(self):
+        return 'Box[{}+>{}]'.format(repr([*self.anchor]), repr([*self.sides]))
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((self._a, self._s))
+        return self._hash
+
+    def __contains__(self, point: Point):
+        point = Point(point)
+        p1 = self.anchor
+        p2 = self.distant
+        return all([p1[dim] < point[dim] < p2[dim] for dim in range(len(self))])
+
+    def __eq__(self, other: 'Box') -> bool:
+        if isinstance(other, Box):
+            return self._a == other._a and self._s == other._s
+        raise NotImplementedError
+
+    def __ne__(self, other: 'Box') -> bool:
+        return not self == other
+
+    @property
+    def area(self) -> float:
+        area = 1.0
+        for s in self.sides:
+            area *= s
+        return area
+
+    def split(self, *points: Point) -> List['Box']:
+        return list(self.isplit(*points))
+
+    def isplit(self, *points: Point) -> Iterator['Box']:
+        ps = [Point(p) for p in points]
+        assert all([len(p) == len(self) for p in ps])
+        bounds = [[self.anchor.coords, self.distant.coords]]
+        cuts = [p.coords for p in ps] or np.empty((0, len(self)))
+        sub, _ = split_bounds(bounds, cuts)
+        canvas = self._c.numpy()
+        anchors = (sub[:, 0] / canvas).tolist()
+        sides = ((sub[:, 1] - sub[:, 0]) / canvas).tolist()
+        for anchor, side in zip(anchors, sides):
+            yield Box._make(tuple(anchor), tuple(side), self._c)
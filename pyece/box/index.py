@@ -0,0 +1,241 @@
+__all__ = [
+    'SpatialIndex',
+    'RTree',
+    'UniformGrid',
+]
+
+from abc import ABC, abstractmethod
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from .array import as_bounds
+from .split import _expand_cells, _repeat_ranges
+
+Pairs = Tuple[np.ndarray, np.ndarray]
+
+
+def _closed_overlap(lo1, hi1, lo2, hi2) -> np.ndarray:
+    return (lo1 <= hi2).all(-1) & (lo2 <= hi1).all(-1)
+
+
+class SpatialIndex(ABC):
+    # NOTE: a static structure is bulk loaded over the boxes known at build
+    # time; later inserts are scanned linearly and deletes are masked until
+    # they outgrow `rebuild` times the static part
+    def __init__(self, boxes, rebuild: float = 0.25):
+        bounds = as_bounds(boxes)
+        self._dim = bounds.shape[-1]
+        self._bounds = np.array(bounds, dtype=float)
+        self._alive = np.ones(len(bounds), dtype=bool)
+        self._size = len(bounds)
+        self._rebuild = rebuild
+        self.rebuild()
+
+    @abstractmethod
+    def _build(self, ids: np.ndarray) -> None:
+        return NotImplemented
+
+    @abstractmethod
+    def _search(self, lo: np.ndarray, hi: np.ndarray) -> Pairs:
+        return NotImplemented
+
+    @property
+    def bounds(self) -> np.ndarray:
+        return self._bounds[: self._size]
+
+    @property
+    def ids(self) -> np.ndarray:
+        return np.flatnonzero(self._alive[: self._size])
+
+    def __len__(self) -> int:
+        return int(self._alive[: self._size].sum())
+
+    def rebuild(self) -> None:
+        ids = self.ids
+        self._built = self._size
+        self._static = len(ids)
+        self._dead = 0
+        self._build(ids)
+
+    def _maybe_rebuild(self) -> None:
+        pending = self._size - self._built + self._dead
+        if pending > self._rebuild * max(self._static, 1):
+            self.rebuild()
+
+    def insert(self, boxes) -> np.ndarray:
+        bounds = as_bounds(boxes)
+        assert bounds.shape[-1] == self._dim
+        ids = np.arange(self._size, self._size + len(bounds))
+        if self._size + len(bounds) > len(self._bounds):
+            capacity = max(2 * len(self._bounds), self._size + len(bounds))
+            self._bounds = np.resize(self._bounds, (capacity, 2, self._dim))
+            self._alive = np.resize(self._alive, capacity)
+        self._bounds[ids] = bounds
+        self._alive[ids] = True
+        self._size += len(bounds)
+        self._maybe_rebuild()
+        return ids
+
+    def delete(self, ids) -> None:
+        ids = np.asarray(ids, dtype=int).reshape(-1)
+        assert (ids < self._size).all()
+        self._dead += int(self._alive[ids].sum())
+        self._alive[ids] = False
+        self._maybe_rebuild()
+
+    def _candidates(self, lo: np.ndarray, hi: np.ndarray) -> Pairs:
+        q, ids = self._search(lo, hi)
+        pending = np.arange(self._built, self._size)
+        if len(pending):
+            plo, phi = self._bounds[pending, 0], self._bounds[pending, 1]
+            pq, pi = np.nonzero(_closed_overlap(lo[:, None], hi[:, None], plo, phi))
+            q = np.concatenate([q, pq])
+            ids = np.concatenate([ids, pending[pi]])
+        keep = self._alive[ids]
+        return q[keep], ids[keep]
+
+    @staticmethod
+    def _sorted(q: np.ndarray, ids: np.ndarray) -> Pairs:
+        order = np.lexsort((ids, q))
+        return q[order], ids[order]
+
+    def query_points(self, points) -> Pairs:
+        points = np.asarray(points, dtype=float).reshape(-1, self._dim)
+        q, ids = self._candidates(points, points)
+        b = self._bounds[ids]
+        inside = ((b[:, 0] < points[q]) & (points[q] < b[:, 1])).all(-1)
+        return self._sorted(q[inside], ids[inside])
+
+    def query_boxes(self, boxes) -> Pairs:
+        bounds = as_bounds(boxes)
+        lo, hi = bounds[:, 0], bounds[:, 1]
+        q, ids = self._candidates(lo, hi)
+        b = self._bounds[ids]
+        overlap = ((b[:, 0] < hi[q]) & (lo[q] < b[:, 1])).all(-1)
+        return self._sorted(q[overlap], ids[overlap])
+
+    def nearest(self, points, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        points = np.asarray(points, dtype=float).reshape(-1, self._dim)
+        result = np.full((len(points), k), -1, dtype=int)
+        distance = np.full((len(points), k), np.inf)
+        alive = self.bounds[self._alive[: self._size]]
+        if len(alive) == 0:
+            return result, distance
+        lo, hi = alive[:, 0].min(0), alive[:, 1].max(0)
+        # NOTE: radius at which every box is a candidate for the point
+        limit = np.linalg.norm(np.maximum(np.abs(points - lo), np.abs(points - hi)), axis=-1)
+        extent = np.where(hi > lo, hi - lo, 1.0)
+        radius = np.full(len(points), (np.prod(extent) / len(alive)) ** (1 / self._dim))
+        todo = np.arange(len(points))
+        while len(todo):
+            p, r = points[todo], radius[todo]
+            q, ids = self._candidates(p - r[:, None], p + r[:, None])
+            b = self._bounds[ids]
+            gap = np.maximum(np.maximum(b[:, 0] - p[q], p[q] - b[:, 1]), 0)
+            d = np.linalg.norm(gap, axis=-1)
+            within = d <= r[q]
+            done = (np.bincount(q[within], minlength=len(todo)) >= k) | (r >= limit[todo])
+            select = within & done[q]
+            q, ids, d = q[select], ids[select], d[select]
+            order = np.lexsort((ids, d, q))
+            q, ids, d = q[order], ids[order], d[order]
+            starts = np.searchsorted(q, q, side='left')
+            rank = np.arange(len(q)) - starts
+            take = rank < k
+            result[todo[q[take]], rank[take]] = ids[take]
+            distance[todo[q[take]], rank[take]] = d[take]
+            todo = todo[~done]
+            radius[todo] *= 2
+        return result, distance
+
+
+class RTree(SpatialIndex):
+    def __init__(self, boxes, capacity: int = 16, rebuild: float = 0.25):
+        assert capacity > 1
+        self._capacity = capacity
+        super().__init__(boxes, rebuild=rebuild)
+
+    def _str_order(self, ids: np.ndarray, centres: np.ndarray, dim: int) -> np.ndarray:
+        order = ids[np.argsort(centres[ids, dim], kind='stable')]
+        if dim == self._dim - 1 or len(ids) <= self._capacity:
+            return order
+        leaves = int(np.ceil(len(ids) / self._capacity))
+        slabs = int(np.ceil(leaves ** (1 / (self._dim - dim))))
+        size = self._capacity * int(np.ceil(leaves / slabs))
+        return np.concatenate([
+            self._str_order(order[s: s + size], centres, dim + 1)
+            for s in range(0, len(order), size)
+        ])
+
+    def _build(self, ids: np.ndarray) -> None:
+        bounds = self._bounds[: self._size]
+        centres = bounds.mean(1)
+        self._order = self._str_order(ids, centres, 0) if len(ids) else ids
+        lo, hi = bounds[self._order, 0], bounds[self._order, 1]
+        self._levels: List[Tuple[np.ndarray, np.ndarray]] = [(lo, hi)]
+        while len(lo) > self._capacity:
+            starts = np.arange(0, len(lo), self._capacity)
+            lo = np.minimum.reduceat(lo, starts)
+            hi = np.maximum.reduceat(hi, starts)
+            self._levels.append((lo, hi))
+
+    def _search(self, lo: np.ndarray, hi: np.ndarray) -> Pairs:
+        top = len(self._levels) - 1
+        count = len(self._levels[top][0])
+        q = np.repeat(np.arange(len(lo)), count)
+        n = np.tile(np.arange(count), len(lo))
+        for level in range(top, -1, -1):
+            nlo, nhi = self._levels[level]
+            keep = _closed_overlap(lo[q], hi[q], nlo[n], nhi[n])
+            q, n = q[keep], n[keep]
+            if level == 0:
+                break
+            below = len(self._levels[level - 1][0])
+            counts = np.minimum(self._capacity, below - n * self._capacity)
+            q = np.repeat(q, counts)
+            n = _repeat_ranges(n * self._capacity, counts)
+        return q, self._order[n]
+
+
+class UniformGrid(SpatialIndex):
+    def __init__(self, boxes, cell: Union[str, float, Tuple[float, ...]] = 'auto', rebuild: float = 0.25):
+        bounds = as_bounds(boxes)
+        if isinstance(cell, str):
+            assert cell == 'auto'
+            sides = bounds[:, 1] - bounds[:, 0]
+            cell = np.median(sides, axis=0) if len(sides) else 1.0
+        cell = np.broadcast_to(np.asarray(cell, dtype=float), bounds.shape[-1:])
+        self._cell = np.where(cell > 0, cell, 1.0)
+        super().__init__(bounds, rebuild=rebuild)
+
+    def _cells(self, points: np.ndarray) -> np.ndarray:
+        return np.floor(points / self._cell).astype(int)
+
+    def _build(self, ids: np.ndarray) -> None:
+        lo = self._cells(self._bounds[ids, 0])
+        hi = self._cells(self._bounds[ids, 1])
+        self._origin = lo.min(0) if len(ids) else np.zeros(self._dim, dtype=int)
+        self._shape = (hi.max(0) - self._origin + 1) if len(ids) else np.ones(self._dim, dtype=int)
+        owner, cells = _expand_cells(lo - self._origin, hi - self._origin)
+        keys = np.ravel_multi_index(tuple(cells.T), tuple(self._shape))
+        order = np.argsort(keys, kind='stable')
+        self._keys = keys[order]
+        self._owners = ids[owner[order]]
+
+    def _search(self, lo: np.ndarray, hi: np.ndarray) -> Pairs:
+        qlo = self._cells(lo) - self._origin
+        qhi = self._cells(hi) - self._origin
+        outside = ((qhi < 0) | (qlo >= self._shape)).any(-1)
+        qlo = np.clip(qlo, 0, self._shape - 1)
+        qhi = np.clip(qhi, 0, self._shape - 1)
+        inside = np.flatnonzero(~outside)
+        owner, cells = _expand_cells(qlo[inside], qhi[inside])
+        keys = np.ravel_multi_index(tuple(cells.T), tuple(self._shape))
+        start = np.searchsorted(self._keys, keys, side='left')
+        stop = np.searchsorted(self._keys, keys, side='right')
+        q = np.repeat(inside[owner], stop - start)
+        ids = self._owners[_repeat_ranges(start, stop - start)]
+        # NOTE: a box spanning several cells is found once per cell
+        pairs = np.unique(np.stack([q, ids], axis=1), axis=0)
+        return pairs[:, 0], pairs[:, 1]
@@ -0,0 +1,162 @@
+__all__ = [
+    'nms',
+    'soft_nms',
+    'weighted_box_fusion',
+]
+
+from collections import defaultdict
+from itertools import product
+from typing import Dict, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from .array import as_bounds
+from .overlap import pairwise_iou
+
+Cell = Union[None, str, float, Tuple[float, ...]]
+
+
+class _Buckets:
+    # NOTE: uniform grid of cells, every box is registered in each cell it touches
+    def __init__(self, cell: np.ndarray):
+        self._cell = cell
+        self._cells: Dict[Tuple[int, ...], Set[int]] = defaultdict(set)
+
+    def _keys(self, bounds: np.ndarray):
+        lo = np.floor(bounds[0] / self._cell).astype(int)
+        hi = np.floor(bounds[1] / self._cell).astype(int)
+        return product(*[range(l, h + 1) for l, h in zip(lo, hi)])
+
+    def add(self, i: int, bounds: np.ndarray) -> None:
+        for key in self._keys(bounds):
+            self._cells[key].add(i)
+
+    def remove(self, i: int, bounds: np.ndarray) -> None:
+        for key in self._keys(bounds):
+            self._cells[key].discard(i)
+
+    def query(self, bounds: np.ndarray) -> np.ndarray:
+        found = set()
+        for key in self._keys(bounds):
+            found.update(self._cells.get(key, ()))
+        return np.fromiter(found, dtype=int, count=len(found))
+
+
+def _cell_size(bounds: np.ndarray, cell: Cell) -> Optional[np.ndarray]:
+    if cell is None:
+        return None
+    if isinstance(cell, str):
+        assert cell == 'auto'
+        sides = bounds[:, 1] - bounds[:, 0]
+        cell = 2 * np.median(sides, axis=0) if len(sides) else 1.0
+    cell = np.broadcast_to(np.asarray(cell, dtype=float), bounds.shape[-1:])
+    return np.where(cell > 0, cell, 1.0)
+
+
+def _static_buckets(bounds: np.ndarray, cell: Cell) -> Optional[_Buckets]:
+    cell = _cell_size(bounds, cell)
+    if cell is None:
+        return None
+    buckets = _Buckets(cell)
+    for i, b in enumerate(bounds):
+        buckets.add(i, b)
+    return buckets
+
+
+def _neighbours(bounds: np.ndarray, i: int, buckets: Optional[_Buckets]) -> np.ndarray:
+    if buckets is None:
+        return np.arange(len(bounds))
+    return buckets.query(bounds[i])
+
+
+def nms(boxes, scores, threshold: float = 0.5, cell: Cell = None) -> np.ndarray:
+    bounds = as_bounds(boxes)
+    scores = np.asarray(scores, dtype=float)
+    assert scores.shape == (len(bounds),)
+    buckets = _static_buckets(bounds, cell)
+    suppressed = np.zeros(len(bounds), dtype=bool)
+    keep = list()
+    for i in np.argsort(-scores, kind='stable'):
+        if suppressed[i]:
+            continue
+        keep.append(i)
+        others = _neighbours(bounds, i, buckets)
+        iou = pairwise_iou(bounds[i:i + 1], bounds[others])[0]
+        suppressed[others[iou > threshold]] = True
+    return np.asarray(keep, dtype=int)
+
+
+def soft_nms(
+    boxes,
+    scores,
+    sigma: float = 0.5,
+    threshold: float = 0.3,
+    score_threshold: float = 0.001,
+    method: str = 'gaussian',
+    cell: Cell = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    assert method in ('gaussian', 'linear')
+    bounds = as_bounds(boxes)
+    scores = np.array(scores, dtype=float)
+    assert scores.shape == (len(bounds),)
+    buckets = _static_buckets(bounds, cell)
+    alive = scores > score_threshold
+    keep = list()
+    while alive.any():
+        i = np.flatnonzero(alive)[np.argmax(scores[alive])]
+        alive[i] = False
+        keep.append(i)
+        others = _neighbours(bounds, i, buckets)
+        others = others[alive[others]]
+        iou = pairwise_iou(bounds[i:i + 1], bounds[others])[0]
+        if method == 'gaussian':
+            decay = np.exp(-(iou ** 2) / sigma)
+        else:
+            decay = np.where(iou > threshold, 1 - iou, 1.0)
+        scores[others] *= decay
+        alive[others] = scores[others] > score_threshold
+    keep = np.asarray(keep, dtype=int)
+    return keep, scores[keep]
+
+
+def weighted_box_fusion(
+    boxes,
+    scores,
+    threshold: float = 0.55,
+    cell: Cell = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    bounds = as_bounds(boxes)
+    scores = np.asarray(scores, dtype=float)
+    assert scores.shape == (len(bounds),)
+    cell = _cell_size(bounds, cell)
+    buckets = None if cell is None else _Buckets(cell)
+
+    fused = np.empty_like(bounds)
+    weights = np.zeros(len(bounds))
+    weighted = np.zeros_like(bounds)
+    members = np.zeros(len(bounds), dtype=int)
+    total = 0
+    for i in np.argsort(-scores, kind='stable'):
+        box = bounds[i]
+        if buckets is None:
+            candidates = np.arange(total)
+        else:
+            candidates = buckets.query(box)
+        match = -1
+        if len(candidates):
+            iou = pairwise_iou(box[None], fused[candidates])[0]
+            if iou.max() > threshold:
+                # NOTE: ties resolve to the earliest cluster as in the exact path
+                match = candidates[iou == iou.max()].min()
+        if match < 0:
+            match = total
+            total += 1
+        elif buckets is not None:
+            buckets.remove(match, fused[match])
+        weights[match] += scores[i]
+        weighted[match] += scores[i] * box
+        members[match] += 1
+        fused[match] = weighted[match] / weights[match] if weights[match] > 0 else box
+        if buckets is not None:
+            buckets.add(match, fused[match])
+    return fused[:total], weights[:total] / members[:total]
@@ -0,0 +1,76 @@
+__all__ = [
+    'pairwise_intersection',
+    'pairwise_iou',
+    'pairwise_giou',
+]
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from .array import as_bounds
+
+KINDS = ('intersection', 'iou', 'giou')
+# NOTE: elements of one (tile, M, D) broadcast block
+TILE_BUDGET = 2 ** 22
+
+
+def _volume(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    return np.prod(np.clip(hi - lo, 0, None), axis=-1)
+
+
+def _overlap(a: np.ndarray, b: np.ndarray, kind: str) -> np.ndarray:
+    a_lo, a_hi = a[:, None, 0], a[:, None, 1]
+    b_lo, b_hi = b[None, :, 0], b[None, :, 1]
+    inter = _volume(np.maximum(a_lo, b_lo), np.minimum(a_hi, b_hi))
+    if kind == 'intersection':
+        return inter
+    union = _volume(a_lo, a_hi) + _volume(b_lo, b_hi) - inter
+    iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+    if kind == 'iou':
+        return iou
+    hull = _volume(np.minimum(a_lo, b_lo), np.maximum(a_hi, b_hi))
+    penalty = np.divide(hull - union, hull, out=np.zeros_like(inter), where=hull > 0)
+    return iou - penalty
+
+
+def _pairwise(
+    kind: str,
+    boxes1,
+    boxes2,
+    tile: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> np.ndarray:
+    assert kind in KINDS
+    a = as_bounds(boxes1)
+    b = as_bounds(boxes2)
+    assert a.shape[-1] == b.shape[-1]
+    if tile is None:
+        tile = max(1, TILE_BUDGET // max(1, len(b) * a.shape[-1]))
+    result = np.empty((len(a), len(b)), dtype=float)
+
+    def fill(start: int) -> None:
+        stop = start + tile
+        result[start:stop] = _overlap(a[start:stop], b, kind)
+
+    starts = range(0, len(a), tile)
+    if workers is None or workers <= 1 or len(starts) <= 1:
+        for start in starts:
+            fill(start)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(fill, starts))
+    return result
+
+
+def pairwise_intersection(boxes1, boxes2, tile: Optional[int] = None, workers: Optional[int] = None) -> np.ndarray:
+    return _pairwise('intersection', boxes1, boxes2, tile=tile, workers=workers)
+
+
+def pairwise_iou(boxes1, boxes2, tile: Optional[int] = None, workers: Optional[int] = None) -> np.ndarray:
+    return _pairwise('iou', boxes1, boxes2, tile=tile, workers=workers)
+
+
+def pairwise_giou(boxes1, boxes2, tile: Optional[int] = None, workers: Optional[int] = None) -> np.ndarray:
+    return _pairwise('giou', boxes1, boxes2, tile=tile, workers=workers)
@@ -0,0 +1,58 @@
+__all__ = [
+    'split_bounds',
+]
+
+from typing import Tuple
+
+import numpy as np
+
+
+def _repeat_ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    # NOTE: concatenation of arange(s, s + c) for every (s, c) pair
+    counts = np.asarray(counts, dtype=int)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + offsets
+
+
+def _expand_cells(lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    extent = hi - lo + 1
+    counts = np.prod(extent, axis=1)
+    owner = np.repeat(np.arange(len(lo)), counts)
+    local = _repeat_ranges(np.zeros(len(lo), dtype=int), counts)
+    cells = np.empty((len(owner), lo.shape[1]), dtype=int)
+    for d in reversed(range(lo.shape[1])):
+        cells[:, d] = lo[owner, d] + local % extent[owner, d]
+        local //= extent[owner, d]
+    return owner, cells
+
+
+def split_bounds(bounds, points) -> Tuple[np.ndarray, np.ndarray]:
+    bounds = np.asarray(bounds, dtype=float)
+    assert bounds.ndim == 3 and bounds.shape[1] == 2
+    dim = bounds.shape[-1]
+    points = np.asarray(points, dtype=float).reshape(-1, dim)
+    lo, hi = bounds[:, 0], bounds[:, 1]
+
+    cuts, starts, counts = list(), list(), list()
+    for d in range(dim):
+        cut = np.unique(points[:, d])
+        # NOTE: only cuts strictly inside a box split it
+        start = np.searchsorted(cut, lo[:, d], side='right')
+        stop = np.searchsorted(cut, hi[:, d], side='left')
+        cuts.append(np.append(cut, 0.0))
+        starts.append(start)
+        counts.append(np.maximum(stop - start, 0))
+    counts = np.stack(counts, axis=1)
+
+    # NOTE: cells of each box in C order, the last dimension varies fastest
+    owner, cells = _expand_cells(np.zeros_like(counts), counts)
+    result = np.empty((len(owner), 2, dim), dtype=float)
+    for d in range(dim):
+        j = cells[:, d]
+        start, count, cut = starts[d][owner], counts[owner, d], cuts[d]
+        last = len(cut) - 1
+        left = cut[np.clip(start + j - 1, 0, last)]
+        right = cut[np.clip(start + j, 0, last)]
+        result[:, 0, d] = np.where(j == 0, lo[owner, d], left)
+        result[:, 1, d] = np.where(j == count, hi[owner, d], right)
+    return result, owner
@@ -0,0 +1,141 @@
+__all__ = [
+    'sweep_union_area',
+    'sweep_intersection_area',
+    'grid_union_area',
+    'grid_intersection_area',
+]
+
+from functools import reduce
+from itertools import product
+from math import prod
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+# NOTE: engines take box bounds as an (N, 2, D) array of [anchor, distant]
+# NOTE: the grid engines hold one cell per compressed coordinate, O((2N)^D)
+GRID_CELLS = 2 ** 24
+
+
+def _as_bounds(bounds) -> np.ndarray:
+    bounds = np.asarray(bounds, dtype=float)
+    assert bounds.ndim == 3 and bounds.shape[1] == 2
+    lo = np.minimum(bounds[:, 0], bounds[:, 1])
+    hi = np.maximum(bounds[:, 0], bounds[:, 1])
+    # NOTE: degenerate boxes have no area and never split anything
+    keep = (hi > lo).all(-1)
+    return np.stack([lo[keep], hi[keep]], axis=1)
+
+
+def _slabs(*bounds: np.ndarray) -> Iterator[Tuple[float, List[np.ndarray]]]:
+    # NOTE: elementary intervals along the first axis, every slab yields the
+    # boxes spanning it projected onto the remaining axes
+    xs = np.unique(np.concatenate([b[:, :, 0].reshape(-1) for b in bounds]))
+    for lo, hi in zip(xs[:-1].tolist(), xs[1:].tolist()):
+        yield hi - lo, [b[(b[:, 0, 0] <= lo) & (b[:, 1, 0] >= hi), :, 1:] for b in bounds]
+
+
+def sweep_union_area(bounds) -> float:
+    bounds = _as_bounds(bounds)
+    if len(bounds) == 0:
+        return 0.0
+    if bounds.shape[-1] == 1:
+        return grid_union_area(bounds)
+    if bounds.shape[-1] > 2:
+        return float(sum(width * sweep_union_area(rest) for width, (rest,) in _slabs(bounds)))
+    (x1, y1), (x2, y2) = bounds[:, 0].T, bounds[:, 1].T
+    ys = np.unique(np.concatenate([y1, y2]))
+    lo = np.searchsorted(ys, y1)
+    hi = np.searchsorted(ys, y2)
+
+    events = np.concatenate([
+        np.stack([x1, np.ones_like(x1), lo, hi], axis=1),
+        np.stack([x2, -np.ones_like(x2), lo, hi], axis=1),
+    ])
+    events = events[np.argsort(events[:, 0], kind='stable')]
+
+    # NOTE: segment tree over elementary y intervals [ys[i], ys[i + 1]]
+    size = len(ys) - 1
+    count = [0] * (4 * size)
+    covered = [0.0] * (4 * size)
+    ys = ys.tolist()
+
+    def update(node, left, right, lo, hi, delta):
+        if hi <= left or right <= lo:
+            return
+        if lo <= left and right <= hi:
+            count[node] += delta
+        else:
+            middle = (left + right) // 2
+            update(2 * node, left, middle, lo, hi, delta)
+            update(2 * node + 1, middle, right, lo, hi, delta)
+        if count[node] > 0:
+            covered[node] = ys[right] - ys[left]
+        elif right - left == 1:
+            covered[node] = 0.0
+        else:
+            covered[node] = covered[2 * node] + covered[2 * node + 1]
+
+    area = 0.0
+    prev = events[0, 0]
+    for x, delta, lo, hi in events.tolist():
+        area += covered[1] * (x - prev)
+        prev = x
+        update(1, 0, size, int(lo), int(hi), int(delta))
+    return area
+
+
+def sweep_intersection_area(*bounds) -> float:
+    bounds = [_as_bounds(b) for b in bounds]
+    if any(len(b) == 0 for b in bounds):
+        return 0.0
+    if bounds[0].shape[-1] == 1:
+        return grid_intersection_area(*bounds)
+    return float(sum(width * sweep_intersection_area(*rest) for width, rest in _slabs(*bounds)))
+
+
+def _compress(*bounds: np.ndarray) -> List[np.ndarray]:
+    dim = bounds[0].shape[-1]
+    return [
+        np.unique(np.concatenate([b[:, :, d].reshape(-1) for b in bounds]))
+        for d in range(dim)
+    ]
+
+
+def _grid_cells(*bounds: np.ndarray) -> int:
+    return prod(len(ax) for ax in _compress(*bounds))
+
+
+def _coverage(bounds: np.ndarray, axes: List[np.ndarray]) -> np.ndarray:
+    dim = len(axes)
+    lo = [np.searchsorted(axes[d], bounds[:, 0, d]) for d in range(dim)]
+    hi = [np.searchsorted(axes[d], bounds[:, 1, d]) for d in range(dim)]
+    # NOTE: D-dimensional difference array, prefix sums give cover counts
+    diff = np.zeros([len(ax) for ax in axes], dtype=np.int64)
+    for mask in product((False, True), repeat=dim):
+        idx = tuple(h if m else l for m, l, h in zip(mask, lo, hi))
+        np.add.at(diff, idx, (-1) ** sum(mask))
+    for d in range(dim):
+        diff = np.cumsum(diff, axis=d)
+    return diff[(slice(0, -1),) * dim] > 0
+
+
+def _cell_volumes(axes: List[np.ndarray]) -> np.ndarray:
+    return reduce(np.multiply.outer, [np.diff(ax) for ax in axes])
+
+
+def grid_union_area(bounds) -> float:
+    bounds = _as_bounds(bounds)
+    if len(bounds) == 0:
+        return 0.0
+    axes = _compress(bounds)
+    return float(_cell_volumes(axes)[_coverage(bounds, axes)].sum())
+
+
+def grid_intersection_area(*bounds) -> float:
+    bounds = [_as_bounds(b) for b in bounds]
+    if any(len(b) == 0 for b in bounds):
+        return 0.0
+    axes = _compress(*bounds)
+    covered = reduce(np.logical_and, [_coverage(b, axes) for b in bounds])
+    return float(_cell_volumes(axes)[covered].sum())
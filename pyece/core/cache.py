@@ -0,0 +1,79 @@
+__all__ = ("LRUCache",)
+
+from collections import OrderedDict
+from threading import Lock
+
+from . import typing as tp
+from .instrument import count
+
+
+class LRUCache:
+    def __init__(self, maxsize: int = 128, maxbytes: tp.Optional[int] = None, name: tp.Optional[str] = None):
+        assert maxsize > 0
+        # NOTE: named caches report cache.<name>.hits/misses to instrument sinks
+        self.name = name
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._data: "OrderedDict[tp.Hashable, tp.Any]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _sizeof(value: tp.Any) -> int:
+        return int(getattr(value, "nbytes", 0))
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: tp.Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: tp.Hashable, default: tp.Any = None) -> tp.Any:
+        with self._lock:
+            hit = key in self._data
+            if hit:
+                self.hits += 1
+                self._data.move_to_end(key)
+                value = self._data[key]
+            else:
+                self.misses += 1
+                value = default
+        if self.name is not None:
+            count(f"cache.{self.name}.{'hits' if hit else 'misses'}")
+        return value
+
+    def put(self, key: tp.Hashable, value: tp.Any) -> None:
+        size = self._sizeof(value)
+        if self._maxbytes is not None and size > self._maxbytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._nbytes -= self._sizeof(self._data.pop(key))
+            self._data[key] = value
+            self._nbytes += size
+            while len(self._data) > self._maxsize or (
+                self._maxbytes is not None and self._nbytes > self._maxbytes
+            ):
+                _, evicted = self._data.popitem(last=False)
+                self._nbytes -= self._sizeof(evicted)
+
+    def get_or_create(self, key: tp.Hashable, fn: tp.Callable[[], tp.Any]) -> tp.Any:
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = fn()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,130 @@
+__all__ = (
+    "Sink",
+    "CounterSink",
+    "LoggingSink",
+    "CallbackSink",
+    "add_sink",
+    "remove_sink",
+    "instrument",
+    "enabled",
+    "timer",
+    "count",
+)
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from threading import Lock
+
+from . import typing as tp
+
+# NOTE: instrumentation is off until a sink is added, hooks then cost one
+# global lookup; records are "timing" in seconds or "count" in units
+_sinks: tp.List["Sink"] = list()
+_null = nullcontext()
+
+
+class Sink(ABC):
+    @abstractmethod
+    def record(self, kind: str, name: str, value: float) -> None:
+        return NotImplemented
+
+
+class CounterSink(Sink):
+    def __init__(self):
+        self._lock = Lock()
+        # NOTE: name -> (calls, total seconds)
+        self.timings: tp.Dict[str, tp.Tuple[int, float]] = dict()
+        self.counters: tp.Dict[str, float] = dict()
+
+    def record(self, kind: str, name: str, value: float) -> None:
+        with self._lock:
+            if kind == "timing":
+                calls, total = self.timings.get(name, (0, 0.0))
+                self.timings[name] = (calls + 1, total + value)
+            else:
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def hit_rate(self, cache: str) -> tp.Optional[float]:
+        with self._lock:
+            hits = self.counters.get(f"cache.{cache}.hits", 0)
+            misses = self.counters.get(f"cache.{cache}.misses", 0)
+        return hits / (hits + misses) if hits + misses else None
+
+    def summary(self) -> tp.Dict[str, tp.Any]:
+        with self._lock:
+            return dict(
+                timings={k: dict(calls=c, total=t, mean=t / c) for k, (c, t) in self.timings.items()},
+                counters=dict(self.counters),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self.timings.clear()
+            self.counters.clear()
+
+
+class LoggingSink(Sink):
+    def __init__(self, logger: tp.Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self._logger = logger or logging.getLogger("pyece")
+        self._level = level
+
+    def record(self, kind: str, name: str, value: float) -> None:
+        self._logger.log(self._level, "%s %s %g", kind, name, value)
+
+
+class CallbackSink(Sink):
+    def __init__(self, fn: tp.Callable[[str, str, float], tp.Any]):
+        assert callable(fn)
+        self._fn = fn
+
+    def record(self, kind: str, name: str, value: float) -> None:
+        self._fn(kind, name, value)
+
+
+def add_sink(sink: Sink) -> Sink:
+    assert isinstance(sink, Sink)
+    _sinks.append(sink)
+    return sink
+
+
+def remove_sink(sink: Sink) -> None:
+    _sinks.remove(sink)
+
+
+@contextmanager
+def instrument(sink: tp.Optional[Sink] = None) -> tp.Iterator[Sink]:
+    sink = add_sink(sink or CounterSink())
+    try:
+        yield sink
+    finally:
+        remove_sink(sink)
+
+
+def enabled() -> bool:
+    return bool(_sinks)
+
+
+def count(name: str, value: float = 1) -> None:
+    if not _sinks:
+        return
+    for sink in tuple(_sinks):
+        sink.record("count", name, value)
+
+
+@contextmanager
+def _timer(name: str) -> tp.Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        for sink in tuple(_sinks):
+            sink.record("timing", name, elapsed)
+
+
+def timer(name: str) -> tp.ContextManager[None]:
+    if not _sinks:
+        return _null
+    return _timer(name)
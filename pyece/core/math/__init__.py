@@ -1 +1,2 @@
 from .rotate import *
+from .rotation import *
@@ -16,49 +16,43 @@ def rotate(
 ) -> np.ndarray:
     pivot = np.asarray(pivot)
     turning = np.asarray(turning)
-    assert pivot.shape == turning.shape
+    # NOTE: turning is a point (D,) or an array of points (..., D)
+    assert pivot.shape == turning.shape[-1:]
     matrix = get_rotate_matrix(angle)
-    return matrix @ (turning - pivot) + pivot
+    return (turning - pivot) @ matrix.T + pivot
 
 
 def get_rotate_matrix(angle: Angle) -> tp.NDArray:
-    if len(angle) == 1:
-        return rotate_matrix_2d(angle[0])
-    elif len(angle) == 3:
+    # NOTE: angles (..., 1) or (..., 3) give matrices (..., 2, 2) or (..., 3, 3)
+    angle = np.asarray(angle, dtype=float)
+    if angle.shape[-1:] == (1,):
+        return rotate_matrix_2d(angle[..., 0])
+    elif angle.shape[-1:] == (3,):
         return rotate_matrix_3d(angle)
     else:
         raise ValueError(f"ndim should be 2 or 3")
 
 
 def rotate_matrix_2d(angle: float) -> tp.NDArray:
-    return np.array(
-        [
-            [np.cos(angle), -np.sin(angle)],
-            [np.sin(angle), np.cos(angle)],
-        ]
-    )
+    c, s = np.cos(angle), np.sin(angle)
+    return np.stack([c, -s, s, c], axis=-1).reshape(np.shape(angle) + (2, 2))
 
 
 def rotate_matrix_3d(angle: Angle3D) -> tp.NDArray:
-    rotate_matrix_x = np.array(
-        [
-            [1, 0, 0],
-            [0, np.cos(angle[0]), -np.sin(angle[0])],
-            [0, np.sin(angle[0]), np.cos(angle[0])],
-        ]
-    )
-    rotate_matrix_y = np.array(
-        [
-            [np.cos(angle[1]), 0.0, np.sin(angle[1])],
-            [0.0, 1.0, 0.0],
-            [-np.sin(angle[1]), 0.0, np.cos(angle[1])],
-        ]
-    )
-    rotate_matrix_z = np.array(
+    # NOTE: closed form of Rx @ Ry @ Rz
+    angle = np.asarray(angle, dtype=float)
+    (cx, cy, cz), (sx, sy, sz) = np.moveaxis(np.cos(angle), -1, 0), np.moveaxis(np.sin(angle), -1, 0)
+    return np.stack(
         [
-            [np.cos(angle[2]), -np.sin(angle[2]), 0.0],
-            [np.sin(angle[2]), np.cos(angle[2]), 0.0],
-            [0.0, 0.0, 1.0],
-        ]
-    )
-    return rotate_matrix_x @ rotate_matrix_y @ rotate_matrix_z
+            cy * cz,
+            -cy * sz,
+            sy,
+            sx * sy * cz + cx * sz,
+            cx * cz - sx * sy * sz,
+            -sx * cy,
+            sx * sz - cx * sy * cz,
+            cx * sy * sz + sx * cz,
+            cx * cy,
+        ],
+        axis=-1,
+    ).reshape(angle.shape[:-1] + (3, 3))
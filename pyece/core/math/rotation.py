@@ -0,0 +1,87 @@
+__all__ = (
+    "euler_matrix",
+    "quaternion_matrix",
+    "axis_angle_matrix",
+    "apply_rotation",
+    "cached_rotate_matrix",
+    "ROTATION_CACHE",
+)
+
+import numpy as np
+
+from .. import typing as tp
+from ..cache import LRUCache
+from .rotate import Angle, get_rotate_matrix
+
+# NOTE: a handful of discrete angles (e.g. 90 degree TTA turns) repeat a lot
+ROTATION_CACHE = LRUCache(maxsize=256, name="rotation")
+# NOTE: angles closer than this share a cached matrix
+CACHE_DECIMALS = 12
+
+
+def euler_matrix(angle: tp.NDArray) -> np.ndarray:
+    # NOTE: (..., 1) angles give (..., 2, 2), (..., 3) x-y-z angles (..., 3, 3)
+    return get_rotate_matrix(angle)
+
+
+def quaternion_matrix(quaternion: tp.NDArray) -> np.ndarray:
+    # NOTE: (..., 4) quaternions as (w, x, y, z), normalized on the fly
+    q = np.asarray(quaternion, dtype=float)
+    assert q.shape[-1] == 4
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    w, x, y, z = np.moveaxis(q, -1, 0)
+    return np.stack(
+        [
+            1 - 2 * (y * y + z * z),
+            2 * (x * y - z * w),
+            2 * (x * z + y * w),
+            2 * (x * y + z * w),
+            1 - 2 * (x * x + z * z),
+            2 * (y * z - x * w),
+            2 * (x * z - y * w),
+            2 * (y * z + x * w),
+            1 - 2 * (x * x + y * y),
+        ],
+        axis=-1,
+    ).reshape(q.shape[:-1] + (3, 3))
+
+
+def axis_angle_matrix(axis: tp.NDArray, angle: tp.NDArray) -> np.ndarray:
+    # NOTE: Rodrigues formula for (..., 3) axes and (...) angles
+    axis = np.asarray(axis, dtype=float)
+    assert axis.shape[-1] == 3
+    axis = axis / np.linalg.norm(axis, axis=-1, keepdims=True)
+    angle = np.asarray(angle, dtype=float)
+    half = angle[..., None] / 2
+    return quaternion_matrix(np.concatenate([np.cos(half), axis * np.sin(half)], axis=-1))
+
+
+def apply_rotation(
+    matrix: tp.NDArray,
+    points: tp.NDArray,
+    pivot: tp.Optional[tp.NDArray] = None,
+) -> np.ndarray:
+    # NOTE: matrix (D, D) or (B, D, D) applied to points (D,), (N, D) or
+    # (B, N, D) with an optional pivot (D,) or (B, D)
+    matrix = np.asarray(matrix, dtype=float)
+    points = np.asarray(points, dtype=float)
+    if pivot is None:
+        return points @ np.swapaxes(matrix, -1, -2)
+    pivot = np.asarray(pivot, dtype=float)
+    if pivot.ndim > 1:
+        pivot = pivot[..., None, :]
+    return (points - pivot) @ np.swapaxes(matrix, -1, -2) + pivot
+
+
+def cached_rotate_matrix(angle: Angle) -> np.ndarray:
+    angle = np.asarray(angle, dtype=float).reshape(-1) % (2 * np.pi)
+    key = tuple(np.round(angle, CACHE_DECIMALS).tolist())
+
+    def create() -> np.ndarray:
+        matrix = get_rotate_matrix(angle)
+        # NOTE: exact turns of a quarter give exact zeros and ones
+        matrix[np.abs(matrix) < 1e-15] = 0.0
+        matrix.setflags(write=False)
+        return matrix
+
+    return ROTATION_CACHE.get_or_create(key, create)
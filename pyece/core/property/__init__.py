@@ -1,3 +1,4 @@
 from .base import *
+from .frame import *
 from .point import *
 from .pointcloud import *
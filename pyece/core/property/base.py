@@ -5,16 +5,20 @@ __all__ = (
     "Source",
     "Convert",
     "Iter",
+    "RandomProperty",
     "RandomUniform",
     "RandomChoice",
     "Transformer",
 )
 
+import copy
 from abc import ABC, abstractmethod
 
 import numpy as np
 
 from .. import typing as tp
+from ..instrument import count, timer
+from .frame import current_frame
 
 LikeProperty = tp.Union["Property", float, int, str]
 PropertySequence = tp.Union[tp.Sequence[LikeProperty], np.ndarray]
@@ -37,14 +41,34 @@ class Property(ABC):
     def get(self) -> tp.Any:
         return NotImplemented
 
+    def dependencies(self) -> tp.Sequence["Property"]:
+        # NOTE: properties read by get, evaluated first within a Frame
+        return ()
+
     @property
     def value(self) -> tp.Any:
-        return self.get()
+        frame = current_frame()
+        if frame is None:
+            return self.get()
+        return frame.evaluate(self)
+
+    def sample(self, size: int) -> np.ndarray:
+        # NOTE: size draws stacked along a new first axis
+        return np.stack([np.asarray(self.get()) for _ in range(size)])
 
     def transform(self, operation: Operation, **kwargs) -> "Property":
         assert isinstance(operation, Operation)
         return operation(**kwargs)(self)
 
+    def transform_chain(self, operations: tp.Sequence[Operation]) -> "Property":
+        instance = self
+        for op in operations:
+            instance = instance.transform(op)
+        return instance
+
+    def sample_chain(self, operations: tp.Sequence[Operation], size: int) -> np.ndarray:
+        return np.stack([np.asarray(self.transform_chain(operations).value) for _ in range(size)])
+
 
 class Constant(Property):
     def __init__(self, value):
@@ -53,6 +77,10 @@ class Constant(Property):
     def get(self) -> tp.Any:
         return self._value
 
+    def sample(self, size: int) -> np.ndarray:
+        value = np.asarray(self._value)
+        return np.repeat(value[None], size, axis=0)
+
 
 def as_property(value: LikeProperty) -> Property:
     if isinstance(value, Property):
@@ -76,6 +104,9 @@ class Convert(Source):
         self._original = as_property(p)
         super().__init__(fn, *args, **kwargs)
 
+    def dependencies(self) -> tp.Sequence[Property]:
+        return (self._original,)
+
     def get(self) -> tp.Any:
         return self._fn(self._original.value, *self._args, **self._kwargs)
 
@@ -96,23 +127,85 @@ class Iter(Property):
         return self._next()
 
 
-# TODO: random state
-class RandomUniform(Property):
-    def __init__(self, low=0.0, high=1.0):
+Seed = tp.Union[None, int, np.random.SeedSequence]
+
+
+class RandomProperty(Property):
+    # NOTE: seed=None draws from the global np.random state, any other seed
+    # gives the property its own Generator; buffer > 0 pre-draws that many
+    # values per generator call and get serves them one by one
+    def __init__(self, seed: Seed = None, buffer: int = 0):
+        assert buffer >= 0
+        self._buffer_size = buffer
+        self.reseed(seed)
+
+    def reseed(self, seed: Seed) -> None:
+        if seed is not None and not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self._seed = seed
+        # NOTE: the global state is looked up on every draw, a module on the
+        # instance would make the property unpicklable
+        self._generator = None if seed is None else np.random.default_rng(seed)
+        self._buffer: tp.Optional[np.ndarray] = None
+        self._position = 0
+
+    def spawn(self, n: int) -> tp.List["RandomProperty"]:
+        # NOTE: independent streams, e.g. one per data loader worker
+        seed = self._seed if self._seed is not None else np.random.SeedSequence()
+        children = list()
+        for child in seed.spawn(n):
+            prop = copy.copy(self)
+            prop.reseed(child)
+            children.append(prop)
+        return children
+
+    @property
+    def _random(self) -> tp.Any:
+        return np.random if self._generator is None else self._generator
+
+    def _integers(self, high: int, size: tp.Any = None) -> tp.Any:
+        if self._generator is not None:
+            return self._generator.integers(high, size=size)
+        return np.random.randint(high, size=size)
+
+    @abstractmethod
+    def _draw(self, size: tp.Optional[int]) -> tp.Any:
+        return NotImplemented
+
+    def get(self) -> tp.Any:
+        if self._buffer_size == 0:
+            return self._draw(None)
+        if self._buffer is None or self._position == len(self._buffer):
+            self._buffer = self._draw(self._buffer_size)
+            self._position = 0
+        value = self._buffer[self._position]
+        self._position += 1
+        return value
+
+    def sample(self, size: int) -> np.ndarray:
+        return self._draw(size)
+
+
+class RandomUniform(RandomProperty):
+    def __init__(self, low=0.0, high=1.0, seed: Seed = None, buffer: int = 0):
         self._low = low
         self._high = high
+        self._shape = np.broadcast(np.asarray(low), np.asarray(high)).shape
+        super().__init__(seed=seed, buffer=buffer)
 
-    def get(self):
-        return np.random.uniform(self._low, self._high)
+    def _draw(self, size):
+        size = None if size is None else (size, *self._shape)
+        return self._random.uniform(self._low, self._high, size=size)
 
 
-# TODO: random state
-class RandomChoice(Property):
-    def __init__(self, items):
+class RandomChoice(RandomProperty):
+    def __init__(self, items, seed: Seed = None, buffer: int = 0):
         self._items = list(items)
+        self._array = np.asarray(self._items)
+        super().__init__(seed=seed, buffer=buffer)
 
-    def get(self):
-        return np.random.choice(self._items)
+    def _draw(self, size):
+        return self._array[self._integers(len(self._items), size=size)]
 
 
 class Transformer:
@@ -121,6 +214,11 @@ class Transformer:
         self._operations = operations
 
     def __call__(self, instance: Property) -> Property:
-        for op in self._operations:
-            instance = instance.transform(op)
-        return instance
+        with timer("property.transform"):
+            return instance.transform_chain(self._operations)
+
+    def sample(self, instance: Property, size: int) -> np.ndarray:
+        # NOTE: size independently augmented values, e.g. (B, N, D) for clouds
+        count("property.samples", size)
+        with timer("property.sample"):
+            return instance.sample_chain(self._operations, size)
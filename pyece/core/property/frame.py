@@ -0,0 +1,69 @@
+__all__ = ("Frame", "current_frame")
+
+import threading
+
+import numpy as np
+
+from .. import typing as tp
+from ..instrument import count
+
+_local = threading.local()
+
+
+class Frame:
+    # NOTE: evaluation context of one sample, every property node is evaluated
+    # at most once while the frame is active and all dependants share its value
+    def __init__(self):
+        self._memo: tp.Dict[int, tp.Tuple[tp.Any, tp.Any]] = dict()
+
+    def __enter__(self) -> "Frame":
+        _stack().append(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        assert _stack().pop() is self
+
+    def __contains__(self, node: tp.Any) -> bool:
+        return id(node) in self._memo
+
+    def __len__(self) -> int:
+        return len(self._memo)
+
+    def clear(self) -> None:
+        self._memo.clear()
+
+    def evaluate(self, node: tp.Any) -> tp.Any:
+        # NOTE: dependencies are evaluated first in depth first post order
+        # without recursion, so get() of a node only hits the memo for them
+        memo = self._memo
+        if id(node) in memo:
+            return _share(memo[id(node)][1])
+        stack = [(node, False)]
+        while stack:
+            item, expanded = stack.pop()
+            if id(item) in memo:
+                continue
+            if expanded:
+                memo[id(item)] = (item, item.get())
+                count("property.frame.nodes")
+                continue
+            stack.append((item, True))
+            stack.extend((dep, False) for dep in item.dependencies() if id(dep) not in memo)
+        return _share(memo[id(node)][1])
+
+
+def _share(value: tp.Any) -> tp.Any:
+    # NOTE: callers get their own copy of arrays as outside of a frame, an in
+    # place edit must not leak into later reads and dependants
+    return value.copy() if isinstance(value, np.ndarray) else value
+
+
+def _stack() -> tp.List[Frame]:
+    if not hasattr(_local, "frames"):
+        _local.frames = list()
+    return _local.frames
+
+
+def current_frame() -> tp.Optional[Frame]:
+    frames = _stack()
+    return frames[-1] if frames else None
@@ -11,8 +11,9 @@ from abc import abstractmethod
 import numpy as np
 
 from .. import typing as tp
-from ..math.rotate import Angle, rotate
-from .base import LikeProperty, Operation, Property, PropertySequence, as_property
+from ..math.rotate import Angle, get_rotate_matrix
+from ..math.rotation import apply_rotation, cached_rotate_matrix
+from .base import Constant, LikeProperty, Operation, Property, PropertySequence, as_property
 
 LikePoint = tp.Union["Point", PropertySequence, tp.NDArray]
 
@@ -21,9 +22,17 @@ class Point(Property):
     def __init__(self, point: PropertySequence):
         self._point = [as_property(p) for p in point]
 
+    def dependencies(self) -> tp.Sequence[Property]:
+        return self._point
+
     def get(self) -> np.ndarray:
         return np.asarray([p.value for p in self._point])
 
+    def sample(self, size: int) -> np.ndarray:
+        if not self._point:
+            return np.zeros((size, 0))
+        return np.stack([p.sample(size) for p in self._point], axis=1)
+
 
 def as_point(value: LikePoint) -> Point:
     if isinstance(value, Point):
@@ -31,8 +40,78 @@ def as_point(value: LikePoint) -> Point:
     return Point(value)
 
 
+def constant_value(value: tp.Any) -> tp.Optional[np.ndarray]:
+    # NOTE: value of a point (or nested points) built only from constants,
+    # None when any part of it has to be evaluated
+    if isinstance(value, np.ndarray):
+        return value
+    if isinstance(value, Constant):
+        return np.asarray(value.value)
+    if isinstance(value, Point):
+        # NOTE: a constant PointCloud keeps only its (N, D) array
+        points = getattr(value, "_points", None)
+        if points is not None:
+            return points
+        value = value._point
+    elif isinstance(value, Property):
+        return None
+    if isinstance(value, (list, tuple)):
+        items = [constant_value(v) for v in value]
+        if any(item is None for item in items):
+            return None
+        return np.asarray(items)
+    return np.asarray(value)
+
+
+def affine(linear: tp.NDArray, pivot: tp.NDArray) -> np.ndarray:
+    # NOTE: homogeneous (..., D+1, D+1) matrix of p -> linear @ (p - pivot) + pivot
+    linear = np.asarray(linear, dtype=float)
+    pivot = np.asarray(pivot, dtype=float)
+    dim = pivot.shape[-1]
+    batch = np.broadcast_shapes(linear.shape[:-2], pivot.shape[:-1])
+    matrix = np.zeros(batch + (dim + 1, dim + 1))
+    matrix[..., :-1, :-1] = linear
+    matrix[..., :-1, -1] = pivot - (linear @ pivot[..., None])[..., 0]
+    matrix[..., -1, -1] = 1
+    return matrix
+
+
+def _pivot(pivot: tp.Optional[LikePoint], default: tp.Optional[Point]) -> np.ndarray:
+    if pivot is not None:
+        return as_point(pivot).value
+    if default is not None:
+        return default.value
+    raise RuntimeError
+
+
+def _pivot_batch(size: int, pivot: tp.Optional[LikePoint], default: tp.Optional[Point]) -> np.ndarray:
+    if pivot is not None:
+        pivot = np.asarray(pivot, dtype=float)
+        return pivot if pivot.ndim == 2 else np.repeat(pivot[None], size, axis=0)
+    if default is not None:
+        return default.sample(size)
+    raise RuntimeError
+
+
 class PointOperation(Operation):
+    # NOTE: params samples the operation parameters once, operation applies
+    # them to a point (D,) or a whole point array (..., D)
+    def params(self, **params) -> tp.Dict[str, tp.Any]:
+        return params
+
+    def params_batch(self, size: int, **params) -> tp.Optional[tp.Dict[str, tp.Any]]:
+        # NOTE: size draws of params stacked along a new first axis, None when
+        # the operation can not be evaluated in batch
+        return None
+
+    def matrix(self, dim: int, **params) -> tp.Optional[np.ndarray]:
+        # NOTE: homogeneous (..., D+1, D+1) matrix of an affine operation with
+        # params from params or params_batch, None otherwise
+        return None
+
     def __call__(self, **params) -> tp.Callable[[LikePoint], Point]:
+        params = self.params(**params)
+
         def inner(point: LikePoint) -> Point:
             point_ = as_point(point).value
             value = self.operation(point_, **params)
@@ -49,35 +128,59 @@ class PointShift(PointOperation):
     def __init__(self, shift: LikePoint):
         self._shift = as_point(shift)
 
-    def __call__(self, **params) -> tp.Callable[[LikePoint], Point]:
-        shift = self._shift.value
-        return super().__call__(shift=shift)
+    def params(self, **params) -> tp.Dict[str, tp.Any]:
+        return dict(shift=self._shift.value)
+
+    def params_batch(self, size: int, **params) -> tp.Optional[tp.Dict[str, tp.Any]]:
+        return dict(shift=self._shift.sample(size))
 
     def operation(self, obj: tp.NDArray, **params) -> tp.NDArray:
         shift: tp.NDArray = params["shift"]
         return obj + shift
 
+    def matrix(self, dim: int, **params) -> tp.Optional[np.ndarray]:
+        shift = np.asarray(params["shift"], dtype=float)
+        if shift.shape[-1:] != (dim,):
+            return None
+        matrix = np.zeros(shift.shape[:-1] + (dim + 1, dim + 1))
+        matrix[..., np.arange(dim + 1), np.arange(dim + 1)] = 1
+        matrix[..., :-1, -1] = shift
+        return matrix
+
 
 class PointRotate(PointOperation):
-    def __init__(self, angle: LikeProperty, pivot: LikePoint = None):
+    # NOTE: cache=True keeps matrices in ROTATION_CACHE, it pays off only for
+    # angles drawn from a small set (TTA, discrete augmentations); continuous
+    # random angles would only churn it
+    def __init__(self, angle: LikeProperty, pivot: LikePoint = None, cache: bool = False):
         self._angle = as_property(angle)
         self._pivot = None if pivot is None else as_point(pivot)
+        self._cache = cache
 
-    def __call__(self, **params) -> tp.Callable[[LikePoint], Point]:
-        pivot: LikePoint = params["pivot"]
+    def _matrix(self, angle: np.ndarray) -> np.ndarray:
+        if self._cache and angle.ndim == 1:
+            return cached_rotate_matrix(angle)
+        return get_rotate_matrix(angle)
+
+    def params(self, **params) -> tp.Dict[str, tp.Any]:
         angle = np.asarray(self._angle.value).reshape(-1) % (2 * np.pi)
-        if pivot is not None:
-            pivot = as_point(pivot).value
-        elif self._pivot is not None:
-            pivot = self._pivot.value
-        else:
-            raise RuntimeError
-        return super().__call__(pivot=pivot, angle=angle)
+        return dict(pivot=_pivot(params.get("pivot"), self._pivot), angle=angle)
+
+    def params_batch(self, size: int, **params) -> tp.Optional[tp.Dict[str, tp.Any]]:
+        angle = self._angle.sample(size).reshape(size, -1) % (2 * np.pi)
+        return dict(pivot=_pivot_batch(size, params.get("pivot"), self._pivot), angle=angle)
 
     def operation(self, obj: tp.NDArray, **params) -> tp.NDArray:
         pivot: tp.NDArray = params["pivot"]
         angle: Angle = params["angle"]
-        return rotate(pivot, obj, angle)
+        return apply_rotation(self._matrix(np.asarray(angle)), obj, pivot)
+
+    def matrix(self, dim: int, **params) -> tp.Optional[np.ndarray]:
+        angle = np.asarray(params["angle"])
+        matrix = self._matrix(angle)
+        if matrix.shape[-2:] != (dim, dim):
+            return None
+        return affine(matrix, params["pivot"])
 
 
 class PointInflation(PointOperation):
@@ -89,18 +192,22 @@ class PointInflation(PointOperation):
         self._factor = as_property(factor)
         self._pivot = None if pivot is None else as_point(pivot)
 
-    def __call__(self, **params) -> tp.Callable[[LikePoint], Point]:
-        pivot: LikePoint = params["pivot"]
+    def params(self, **params) -> tp.Dict[str, tp.Any]:
         factor = self._factor.value
-        if pivot is not None:
-            pivot = as_point(pivot).value
-        elif self._pivot is not None:
-            pivot = self._pivot.value
-        else:
-            raise RuntimeError
-        return super().__call__(pivot=pivot, factor=factor)
+        return dict(pivot=_pivot(params.get("pivot"), self._pivot), factor=factor)
+
+    def params_batch(self, size: int, **params) -> tp.Optional[tp.Dict[str, tp.Any]]:
+        factor = self._factor.sample(size).reshape(size, -1)
+        return dict(pivot=_pivot_batch(size, params.get("pivot"), self._pivot), factor=factor)
 
     def operation(self, obj: tp.NDArray, **params) -> tp.NDArray:
         pivot: tp.NDArray = params["pivot"]
         factor: tp.NDArray = params["factor"]
         return pivot + (obj - pivot) * factor
+
+    def matrix(self, dim: int, **params) -> tp.Optional[np.ndarray]:
+        factor = np.asarray(params["factor"], dtype=float)
+        factor = factor.reshape(1) if factor.ndim == 0 else factor
+        if factor.shape[-1] not in (1, dim):
+            return None
+        return affine(np.eye(dim) * factor[..., None, :], params["pivot"])
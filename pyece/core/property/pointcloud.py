@@ -5,6 +5,8 @@ __all__ = (
 
 from itertools import product
 
+import numpy as np
+
 from .. import typing as tp
 from .base import (
     Operation,
@@ -17,12 +19,31 @@ from .point import (
     PointOperation,
     PointRotate,
     as_point,
+    constant_value,
 )
 
 
 class PointCloud(Point):
+    # NOTE: constant clouds keep their points as one (N, D) array, clouds of
+    # evaluated properties keep the points and stack them on every get
     def __init__(self, points: tp.Sequence[LikePoint]):
-        super().__init__([as_point(p) for p in points])
+        points = np.array(points) if isinstance(points, np.ndarray) else list(points)
+        self._points = constant_value(points)
+        if self._points is None:
+            super().__init__([as_point(p) for p in points])
+
+    def dependencies(self) -> tp.Sequence[Property]:
+        return () if self._points is not None else self._point
+
+    def get(self) -> tp.NDArray:
+        if self._points is None:
+            return super().get()
+        return self._points.copy()
+
+    def sample(self, size: int) -> np.ndarray:
+        if self._points is None:
+            return super().sample(size)
+        return np.repeat(self._points[None], size, axis=0)
 
     def transform(self, operation: Operation, **kwargs) -> Property:
         if isinstance(operation, PointOperation):
@@ -30,10 +51,65 @@ class PointCloud(Point):
             if isinstance(operation, (PointRotate, PointInflation)):
                 if operation._pivot is None:
                     kwargs["pivot"] = points.mean(0)
-            fn = operation(**kwargs)
-            return PointCloud(tuple(map(fn, points)))
+            params = operation.params(**kwargs)
+            return PointCloud(operation.operation(points, **params))
         return super().transform(operation, **kwargs)
 
+    def transform_chain(self, operations: tp.Sequence[Operation]) -> Property:
+        # NOTE: runs of affine point operations are folded into one homogeneous
+        # matrix and applied once; a default pivot is the mean of the points
+        # so far, which the pending matrix carries along exactly
+        points = self.value
+        dim = points.shape[-1]
+        matrix = np.eye(dim + 1)
+        for i, op in enumerate(operations):
+            params = None
+            if isinstance(op, PointOperation):
+                kwargs = dict()
+                if isinstance(op, (PointRotate, PointInflation)) and op._pivot is None:
+                    kwargs["pivot"] = _apply(matrix, points.mean(0))
+                params = op.params(**kwargs)
+                step = op.matrix(dim, **params)
+                if step is not None:
+                    matrix = step @ matrix
+                    continue
+            points = _apply(matrix, points)
+            matrix = np.eye(dim + 1)
+            if params is None:
+                instance = PointCloud(points).transform(op)
+                return instance.transform_chain(operations[i + 1:])
+            points = op.operation(points, **params)
+        return PointCloud(_apply(matrix, points))
+
+    def sample_chain(self, operations: tp.Sequence[Operation], size: int) -> np.ndarray:
+        # NOTE: same folding as transform_chain with one matrix per draw,
+        # (B, N, D) points go through (B, D+1, D+1) matrices in one matmul
+        points = self.sample(size)
+        dim = points.shape[-1]
+        matrix = np.broadcast_to(np.eye(dim + 1), (size, dim + 1, dim + 1))
+        for i, op in enumerate(operations):
+            params = None
+            if isinstance(op, PointOperation):
+                kwargs = dict()
+                if isinstance(op, (PointRotate, PointInflation)) and op._pivot is None:
+                    kwargs["pivot"] = _apply(matrix, points.mean(1))
+                params = op.params_batch(size, **kwargs)
+            step = None if params is None else op.matrix(dim, **params)
+            if step is None:
+                # NOTE: the rest of the chain runs draw by draw
+                points = _apply(matrix, points)
+                return np.stack([PointCloud(p).transform_chain(operations[i:]).value for p in points])
+            matrix = step @ matrix
+        return _apply(matrix, points)
+
+
+def _apply(matrix: np.ndarray, points: np.ndarray) -> np.ndarray:
+    # NOTE: matrix (..., D+1, D+1) applied to points (..., N, D) or (..., D)
+    linear, shift = matrix[..., :-1, :-1], matrix[..., :-1, -1]
+    if points.ndim == matrix.ndim:
+        return points @ np.swapaxes(linear, -1, -2) + shift[..., None, :]
+    return (linear @ points[..., None])[..., 0] + shift
+
 
 LikePointCloud = tp.Union[PointCloud, tp.Sequence[LikePoint]]
 
@@ -1,6 +1,16 @@
 from typing import *
-import nptyping as nptp
 
-NDArray = nptp.NDArray
-IntTuple = Union[NDArray[nptp.Shape["*"], nptp.Integer], Tuple[int, ...]]
-FloatTuple = Union[NDArray[nptp.Shape["*"], nptp.Float], Tuple[float, ...]]
+import numpy as np
+
+if TYPE_CHECKING:
+    import nptyping as nptp
+
+    NDArray = nptp.NDArray
+    IntTuple = Union[NDArray[nptp.Shape["*"], nptp.Integer], Tuple[int, ...]]
+    FloatTuple = Union[NDArray[nptp.Shape["*"], nptp.Float], Tuple[float, ...]]
+else:
+    # NOTE: nptyping is only needed by type checkers, importing it costs more
+    # than the rest of pyece, so at runtime the aliases are plain numpy
+    NDArray = np.ndarray
+    IntTuple = Union[np.ndarray, Tuple[int, ...]]
+    FloatTuple = Union[np.ndarray, Tuple[float, ...]]
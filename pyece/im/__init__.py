@@ -0,0 +1,6 @@
+from .blend import *
+from .executor import *
+from .mesh import *
+from .patch import *
+from .source import *
+from .wrapper import *
@@ -0,0 +1,108 @@
+__all__ = ("BLENDS", "blend_weights", "Stitcher")
+
+import functools
+
+import numpy as np
+
+from ..core import typing as tp
+
+BLENDS = ("constant", "linear", "gaussian")
+
+
+def _window(size: int, blend: str, sigma: float) -> np.ndarray:
+    # NOTE: distance of voxel centres from the patch centre in voxels
+    x = np.arange(size) - (size - 1) / 2
+    if blend == "constant":
+        return np.ones(size)
+    if blend == "linear":
+        return 1 - np.abs(x) / (size / 2 + 0.5)
+    return np.exp(-0.5 * (x / max(sigma * size, 1e-6)) ** 2)
+
+
+@functools.lru_cache(maxsize=16)
+def _blend_weights(size: tp.Tuple[int, ...], blend: str, sigma: float) -> np.ndarray:
+    weights = np.ones(())
+    for s in size:
+        weights = np.multiply.outer(weights, _window(s, blend, sigma))
+    weights = weights / weights.max()
+    weights.setflags(write=False)
+    return weights
+
+
+def blend_weights(size: tp.IntTuple, blend: str = "gaussian", sigma: float = 0.125) -> np.ndarray:
+    assert blend in BLENDS
+    assert sigma > 0
+    return _blend_weights(tuple(int(s) for s in size), blend, float(sigma))
+
+
+def _slabs(shape: tp.Tuple[int, ...], nbytes: int, budget: int = 2**26) -> tp.Iterator[slice]:
+    # NOTE: slices along the first axis touching about `budget` bytes each
+    rows = max(1, budget // max(nbytes // max(shape[0], 1), 1)) if shape else 1
+    for start in range(0, shape[0] if shape else 1, rows):
+        yield slice(start, start + rows)
+
+
+class Stitcher:
+    # NOTE: accumulates weighted patch results into one volume, only the output
+    # and the patch placements are held regardless of the patch count, the
+    # weight sum is rebuilt per slab from the placements when normalizing;
+    # out may be any float array supporting slice reads and writes (np.memmap,
+    # h5py.Dataset), it is updated in place by read-modify-write
+    def __init__(
+        self,
+        shape: tp.IntTuple,
+        size: tp.IntTuple,
+        blend: str = "gaussian",
+        sigma: float = 0.125,
+        out: tp.Any = None,
+    ):
+        self._shape = tuple(int(s) for s in shape)
+        self._weights = blend_weights(size, blend, sigma)
+        self._dim = self._weights.ndim
+        self._placements: tp.List[tp.Tuple[slice, ...]] = list()
+        self._out = out
+        if out is not None:
+            assert tuple(out.shape[: self._dim]) == self._shape
+            # NOTE: integer outputs would truncate every partial sum
+            assert np.issubdtype(out.dtype, np.inexact), "out must be a float array"
+            for slab in _slabs(tuple(out.shape), out.dtype.itemsize * int(np.prod(out.shape))):
+                out[slab] = 0
+
+    def add(self, idx: tp.Tuple[slice, ...], result: tp.NDArray) -> None:
+        result = np.asarray(result)
+        assert result.shape[: self._dim] == self._weights.shape
+        tail = result.shape[self._dim:]
+        if self._out is None:
+            dtype = np.result_type(result.dtype, np.float32)
+            self._out = np.zeros((*self._shape, *tail), dtype=dtype)
+        weights = self._weights.reshape(self._weights.shape + (1,) * len(tail))
+        if isinstance(self._out, np.ndarray):
+            self._out[idx] += result * weights
+        else:
+            self._out[idx] = self._out[idx] + result * weights
+        self._placements.append(tuple(slice(*s.indices(n)[:2]) for s, n in zip(idx, self._shape)))
+
+    def _norm(self, slab: slice) -> np.ndarray:
+        start, stop, _ = slab.indices(self._shape[0])
+        norm = np.zeros((stop - start, *self._shape[1:]), dtype=np.float64)
+        for placement in self._placements:
+            lo, hi = max(start, placement[0].start), min(stop, placement[0].stop)
+            if lo < hi:
+                rows = slice(lo - placement[0].start, hi - placement[0].start)
+                norm[(slice(lo - start, hi - start), *placement[1:])] += self._weights[rows]
+        return norm
+
+    def result(self) -> tp.Any:
+        if self._out is None:
+            return np.zeros(self._shape)
+        out = self._out
+        tail = (1,) * (len(out.shape) - self._dim)
+        for slab in _slabs(tuple(out.shape), out.dtype.itemsize * int(np.prod(out.shape))):
+            norm = self._norm(slab)
+            norm = norm.reshape(norm.shape + tail)
+            if isinstance(out, np.ndarray):
+                np.divide(out[slab], norm, out=out[slab], where=norm > 0)
+            else:
+                value = out[slab]
+                out[slab] = np.divide(value, norm, out=value, where=norm > 0)
+        return out
@@ -0,0 +1,175 @@
+__all__ = (
+    "PatchReader",
+    "PatchExecutor",
+    "SequentialExecutor",
+    "ThreadExecutor",
+    "ProcessExecutor",
+    "BatchExecutor",
+)
+
+import copy
+import mmap
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ..core import typing as tp
+from ..core.instrument import timer
+from .source import MemmapSource
+
+# NOTE: a task addresses one patch, a list of tasks addresses a batch of them
+Task = tp.Any
+Submit = tp.Callable[[Task], Future]
+
+
+class PatchReader:
+    def __init__(self, data: tp.Any):
+        self.data = data
+
+    def read(self, task: Task) -> np.ndarray:
+        return self.data[task]
+
+    def __call__(self, task: Task) -> np.ndarray:
+        if isinstance(task, list):
+            return np.stack([self.read(t) for t in task])
+        return self.read(task)
+
+    def replace(self, data: tp.Any) -> "PatchReader":
+        reader = copy.copy(self)
+        reader.data = data
+        return reader
+
+
+def _run(fn: tp.Callable, read: PatchReader, task: Task) -> tp.Any:
+    # NOTE: process workers have no sinks, only the calling process reports
+    with timer("im.patch.read"):
+        patch = read(task)
+    with timer("im.patch.func"):
+        return fn(patch)
+
+
+class PatchExecutor(ABC):
+    @abstractmethod
+    def imap(
+        self,
+        fn: tp.Callable,
+        read: PatchReader,
+        tasks: tp.Sequence[Task],
+    ) -> tp.Iterator[tp.Tuple[int, tp.Any]]:
+        return NotImplemented
+
+
+class SequentialExecutor(PatchExecutor):
+    def imap(self, fn, read, tasks):
+        for i, task in enumerate(tasks):
+            yield i, _run(fn, read, task)
+
+
+class _PoolExecutor(PatchExecutor):
+    def __init__(self, workers: tp.Optional[int] = None, inflight: tp.Optional[int] = None):
+        self._workers = workers or os.cpu_count() or 1
+        # NOTE: bounds the patches and results held in memory at once
+        self._inflight = inflight or 2 * self._workers
+        assert self._inflight > 0
+
+    @abstractmethod
+    def _open(self, fn: tp.Callable, read: PatchReader) -> tp.ContextManager[Submit]:
+        return NotImplemented
+
+    def imap(self, fn, read, tasks):
+        tasks = iter(enumerate(tasks))
+        with self._open(fn, read) as submit:
+            pending: tp.Dict[Future, int] = dict()
+
+            def refill():
+                while len(pending) < self._inflight:
+                    item = next(tasks, None)
+                    if item is None:
+                        return
+                    pending[submit(item[1])] = item[0]
+
+            refill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+                refill()
+
+
+class ThreadExecutor(_PoolExecutor):
+    @contextmanager
+    def _open(self, fn, read):
+        with ThreadPoolExecutor(max_workers=self._workers) as pool:
+            yield lambda task: pool.submit(_run, fn, read, task)
+
+
+_worker: tp.Dict[str, tp.Any] = dict()
+
+
+def _attach(name: str, shape: tp.Tuple[int, ...], dtype: str, fn: tp.Callable, read: PatchReader):
+    memory = shared_memory.SharedMemory(name=name)
+    data = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+    _worker.update(memory=memory, fn=fn, read=read.replace(data))
+
+
+def _setup(fn: tp.Callable, read: PatchReader):
+    _worker.update(fn=fn, read=read)
+
+
+def _work(task: Task) -> tp.Any:
+    return _run(_worker["fn"], _worker["read"], task)
+
+
+class ProcessExecutor(_PoolExecutor):
+    # NOTE: an in-memory volume is copied once into shared memory, workers only
+    # receive patch tasks and send back results; fn must be picklable and
+    # out-of-core sources are pickled to reopen their storage in each worker,
+    # a whole-file memmap is reopened the same way through MemmapSource
+    @contextmanager
+    def _open(self, fn, read):
+        data = read.data
+        if isinstance(data, np.memmap) and isinstance(data.base, mmap.mmap) and data.flags.c_contiguous:
+            read = read.replace(MemmapSource.from_memmap(data))
+        if not isinstance(read.data, np.ndarray):
+            with ProcessPoolExecutor(self._workers, initializer=_setup, initargs=(fn, read)) as pool:
+                yield lambda task: pool.submit(_work, task)
+            return
+        data = np.ascontiguousarray(read.data)
+        memory = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+        try:
+            np.ndarray(data.shape, dtype=data.dtype, buffer=memory.buf)[...] = data
+            initargs = (memory.name, data.shape, data.dtype.str, fn, read.replace(None))
+            with ProcessPoolExecutor(self._workers, initializer=_attach, initargs=initargs) as pool:
+                yield lambda task: pool.submit(_work, task)
+        finally:
+            memory.close()
+            memory.unlink()
+
+
+class _Batched:
+    def __init__(self, fn: tp.Callable):
+        self._fn = fn
+
+    def __call__(self, patches: np.ndarray) -> tp.Sequence[tp.Any]:
+        results = self._fn(patches)
+        assert len(results) == len(patches)
+        return results
+
+
+class BatchExecutor(PatchExecutor):
+    # NOTE: fn receives stacked (B, *patch) arrays and returns B results
+    def __init__(self, size: int, executor: tp.Optional[PatchExecutor] = None):
+        assert size > 0
+        self._size = size
+        self._executor = executor or SequentialExecutor()
+
+    def imap(self, fn, read, tasks):
+        tasks = list(tasks)
+        batches = [tasks[i: i + self._size] for i in range(0, len(tasks), self._size)]
+        for b, results in self._executor.imap(_Batched(fn), read, batches):
+            for j, result in enumerate(results):
+                yield b * self._size + j, result
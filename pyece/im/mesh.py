@@ -0,0 +1,73 @@
+__all__ = (
+    "linspace",
+    "meshcorners",
+    "meshcorners_batch",
+    "mesh_offsets",
+    "MESH_CACHE",
+)
+
+import numpy as np
+
+from ..core import typing as tp
+from ..core.cache import LRUCache
+from ..core.instrument import timer
+
+# NOTE: offsets are a few floats per axis, the cache only saves rebuilding them
+MESH_CACHE = LRUCache(maxsize=32, name="mesh")
+
+
+def linspace(start, end, count: int):
+    # NOTE: np.linspace works ~ 8 times faster
+    start = np.asarray(start)
+    end = np.asarray(end)
+    C = (end - start) / (count)
+    return start + np.asarray([C * (k + 0.5) for k in range(count)])
+
+
+def _mesh_offsets(grid: tp.Tuple[int, ...]) -> tp.Tuple[np.ndarray, ...]:
+    # NOTE: k + 0.5 along every axis, shaped to broadcast over the axes after it
+    return tuple((np.arange(n) + 0.5).reshape(n, *[1] * (len(grid) - d)) for d, n in enumerate(grid))
+
+
+def mesh_offsets(grid: tp.IntTuple) -> tp.Tuple[np.ndarray, ...]:
+    grid = tuple(int(g) for g in grid)
+    return MESH_CACHE.get_or_create(grid, lambda: _mesh_offsets(grid))
+
+
+def _mesh(corners: np.ndarray, grid: tp.Tuple[int, ...], lead: int) -> np.ndarray:
+    # NOTE: corners are (*lead, 2, ..., 2, P); axes are filled from the last one
+    # with the float operations of the recursive linspace, so the mesh matches
+    # it bit for bit and rounding half-pixel samples picks the same voxels
+    for d, offsets in reversed(list(enumerate(mesh_offsets(grid)))):
+        at = (slice(None),) * (lead + d)
+        start, end = corners[(*at, slice(0, 1))], corners[(*at, slice(1, 2))]
+        step = (end - start) / len(offsets)
+        corners = start + step * offsets.astype(step.dtype, copy=False)
+    return corners
+
+
+def meshcorners(corners: tp.NDArray, grid: tp.IntTuple):
+    corners = np.asarray(corners)
+    grid = tuple(int(g) for g in grid)
+    c = len(corners) // 2
+    if c == 0:
+        return corners[0]
+    assert len(corners) == 2 ** len(grid)
+    with timer("im.meshcorners"):
+        mesh = _mesh(corners.reshape(*[2] * len(grid), -1), grid, 0)
+    return mesh.reshape(*grid, *corners.shape[1:])
+
+
+def _meshcorners_batch(corners: tp.NDArray, grid: tp.IntTuple) -> np.ndarray:
+    corners = np.asarray(corners)
+    grid = tuple(int(g) for g in grid)
+    batch, count = corners.shape[:2]
+    assert count == 2 ** len(grid)
+    # NOTE: (P, B, *grid), every mesh of the batch is built at once
+    with timer("im.meshcorners"):
+        mesh = _mesh(corners.reshape(batch, *[2] * len(grid), -1), grid, 1)
+    return np.moveaxis(mesh, -1, 0)
+
+
+def meshcorners_batch(corners: tp.NDArray, grid: tp.IntTuple) -> np.ndarray:
+    return np.moveaxis(_meshcorners_batch(corners, grid), 0, -1)
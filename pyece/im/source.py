@@ -0,0 +1,404 @@
+__all__ = (
+    "ArraySource",
+    "MemmapSource",
+    "H5Source",
+    "ChunkedSource",
+    "as_source",
+    "save_chunked",
+)
+
+import itertools
+import json
+import mmap
+import os
+import sys
+import zlib
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from ..core import typing as tp
+from ..core.cache import LRUCache
+from ..core.instrument import count
+
+if tp.TYPE_CHECKING:
+    import h5py as h5  # type: ignore
+
+Region = tp.Tuple[slice, ...]
+# NOTE: "volume.h5::group/data" addresses a dataset inside an HDF5 file
+H5_SUFFIXES = (".h5", ".hdf5", ".hdf")
+H5_SEPARATOR = "::"
+
+
+def _h5py():
+    # NOTE: h5py is imported on first use of an HDF5 file, it is slow to import
+    import h5py  # type: ignore
+
+    return h5py
+
+
+def _is_dataset(data: tp.Any) -> bool:
+    # NOTE: without h5py imported no object can be one of its datasets
+    h5py = sys.modules.get("h5py")
+    return h5py is not None and isinstance(data, h5py.Dataset)
+
+
+def _region(index: tp.Any, shape: tp.Tuple[int, ...]) -> tp.Tuple[Region, tp.Tuple[int, ...]]:
+    # NOTE: basic indexing only, integer axes are read as unit slices and dropped
+    if not isinstance(index, tuple):
+        index = (index,)
+    if any(i is Ellipsis for i in index):
+        at = index.index(Ellipsis)
+        index = index[:at] + (slice(None),) * (len(shape) - len(index) + 1) + index[at + 1:]
+    index = index + (slice(None),) * (len(shape) - len(index))
+    assert len(index) == len(shape)
+    region, drop = list(), list()
+    for axis, (i, size) in enumerate(zip(index, shape)):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(size)
+            assert step == 1, "sources support unit steps only"
+            region.append(slice(start, max(start, stop)))
+        else:
+            i = int(i) + size if int(i) < 0 else int(i)
+            assert 0 <= i < size
+            region.append(slice(i, i + 1))
+            drop.append(axis)
+    return tuple(region), tuple(drop)
+
+
+def _assemble(
+    region: Region,
+    chunks: tp.Tuple[int, ...],
+    dtype: np.dtype,
+    fetch: tp.Callable[[tp.Tuple[int, ...]], np.ndarray],
+) -> np.ndarray:
+    out = np.empty([r.stop - r.start for r in region], dtype=dtype)
+    if out.size == 0:
+        return out
+    ranges = [range(r.start // c, (r.stop - 1) // c + 1) for r, c in zip(region, chunks)]
+    for index in itertools.product(*ranges):
+        chunk = fetch(index)
+        src, dst = list(), list()
+        for i, c, r in zip(index, chunks, region):
+            lo, hi = max(r.start, i * c), min(r.stop, (i + 1) * c)
+            src.append(slice(lo - i * c, hi - i * c))
+            dst.append(slice(lo - r.start, hi - r.start))
+        out[tuple(dst)] = chunk[tuple(src)]
+    return out
+
+
+class ArraySource(ABC):
+    # NOTE: read-only array stored out of core; reads are addressed by regions
+    # of unit step slices and optionally served from an LRU cache of chunks
+    def __init__(self, cache: tp.Optional[LRUCache] = None):
+        self.cache = cache
+
+    @property
+    @abstractmethod
+    def shape(self) -> tp.Tuple[int, ...]:
+        return NotImplemented
+
+    @property
+    @abstractmethod
+    def dtype(self) -> np.dtype:
+        return NotImplemented
+
+    @property
+    def chunks(self) -> tp.Optional[tp.Tuple[int, ...]]:
+        return None
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @abstractmethod
+    def _read(self, region: Region) -> np.ndarray:
+        return NotImplemented
+
+    def _key(self) -> tp.Hashable:
+        return id(self)
+
+    def _read_chunk(self, index: tp.Tuple[int, ...]) -> np.ndarray:
+        region = tuple(
+            slice(i * c, min((i + 1) * c, s)) for i, c, s in zip(index, self.chunks, self.shape)
+        )
+        return self._read(region)
+
+    def _load_chunk(self, index: tp.Tuple[int, ...]) -> np.ndarray:
+        chunk = self._read_chunk(index)
+        count("im.bytes_read", chunk.nbytes)
+        return chunk
+
+    def read_region(self, region: Region) -> np.ndarray:
+        region, _ = _region(region, self.shape)
+        if self.cache is None or self.chunks is None:
+            value = self._read(region)
+            count("im.bytes_read", value.nbytes)
+            return value
+        key = self._key()
+        return _assemble(
+            region,
+            self.chunks,
+            self.dtype,
+            lambda index: self.cache.get_or_create((key, index), lambda: self._load_chunk(index)),
+        )
+
+    def __getitem__(self, index: tp.Any) -> np.ndarray:
+        region, drop = _region(index, self.shape)
+        value = self.read_region(region)
+        return value.reshape([n for axis, n in enumerate(value.shape) if axis not in drop])
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        value = self.read_region(tuple(slice(None) for _ in self.shape))
+        return value if dtype is None else value.astype(dtype)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getstate__(self) -> tp.Dict[str, tp.Any]:
+        # NOTE: a cache is not shared across processes, copies get a fresh one
+        state = self.__dict__.copy()
+        cache = state.pop("cache")
+        state["_cache_config"] = None if cache is None else (cache._maxsize, cache._maxbytes)
+        return state
+
+    def __setstate__(self, state: tp.Dict[str, tp.Any]) -> None:
+        config = state.pop("_cache_config")
+        self.__dict__.update(state)
+        self.cache = None if config is None else LRUCache(*config)
+
+
+class MemmapSource(ArraySource):
+    # NOTE: .npy files are opened with mmap, raw files need dtype and shape and
+    # start `offset` bytes into the file
+    def __init__(
+        self,
+        path: tp.Union[str, os.PathLike],
+        dtype: tp.Any = None,
+        shape: tp.Optional[tp.IntTuple] = None,
+        chunks: tp.Optional[tp.IntTuple] = None,
+        cache: tp.Optional[LRUCache] = None,
+        offset: int = 0,
+    ):
+        super().__init__(cache)
+        assert dtype is not None or offset == 0
+        self._path = os.fspath(path)
+        self._dtype = dtype
+        self._shape = None if shape is None else tuple(int(s) for s in shape)
+        self._chunks = None if chunks is None else tuple(int(c) for c in chunks)
+        self._offset = int(offset)
+        self._open()
+
+    @classmethod
+    def from_memmap(cls, data: np.memmap, **kwargs) -> "MemmapSource":
+        # NOTE: only a memmap spanning its whole mapping is described by its
+        # filename and offset, views of one are not
+        assert isinstance(data.base, mmap.mmap) and data.flags.c_contiguous
+        data.flush()
+        return cls(data.filename, dtype=data.dtype, shape=data.shape, offset=data.offset, **kwargs)
+
+    def _open(self) -> None:
+        if self._dtype is None:
+            self._data = np.load(self._path, mmap_mode="r")
+        else:
+            self._data = np.memmap(self._path, dtype=self._dtype, mode="r", shape=self._shape, offset=self._offset)
+
+    @property
+    def shape(self):
+        return self._data.shape
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    @property
+    def chunks(self):
+        return self._chunks
+
+    def _key(self):
+        return self._path, self._offset
+
+    def _read(self, region):
+        return np.array(self._data[region])
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop("_data")
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._open()
+
+
+class H5Source(ArraySource):
+    # NOTE: files opened by the source itself, by open or when unpickled, are
+    # closed with it; a dataset passed in stays owned by the caller
+    def __init__(self, dataset: "h5.Dataset", cache: tp.Optional[LRUCache] = None):
+        super().__init__(cache)
+        self._dataset = dataset
+        self._file: tp.Optional["h5.File"] = None
+
+    @classmethod
+    def open(cls, path: tp.Union[str, os.PathLike], name: str, cache: tp.Optional[LRUCache] = None) -> "H5Source":
+        file = _h5py().File(os.fspath(path), "r")
+        source = cls(file[name], cache=cache)
+        source._file = file
+        return source
+
+    def close(self) -> None:
+        file, self._file = getattr(self, "_file", None), None
+        if file is not None:
+            file.close()
+
+    def __enter__(self) -> "H5Source":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    @property
+    def shape(self):
+        return self._dataset.shape
+
+    @property
+    def dtype(self):
+        return self._dataset.dtype
+
+    @property
+    def chunks(self):
+        return self._dataset.chunks
+
+    def _key(self):
+        return self._dataset.file.filename, self._dataset.name
+
+    def _read(self, region):
+        return self._dataset[region]
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        dataset = state.pop("_dataset")
+        state.pop("_file")
+        state["_location"] = (dataset.file.filename, dataset.name)
+        return state
+
+    def __setstate__(self, state):
+        filename, name = state.pop("_location")
+        super().__setstate__(state)
+        self._file = _h5py().File(filename, "r")
+        self._dataset = self._file[name]
+
+
+CHUNKED_META = ".zarray"
+CHUNKED_COMPRESSORS = (None, "zlib")
+
+
+class ChunkedSource(ArraySource):
+    # NOTE: zarr v2 style directory, a .zarray json with shape, chunks, dtype
+    # and fill_value plus one C ordered file per chunk named "i.j.k";
+    # chunks are raw or zlib compressed, missing chunks hold fill_value
+    def __init__(self, path: tp.Union[str, os.PathLike], cache: tp.Optional[LRUCache] = None):
+        super().__init__(cache)
+        self._path = os.fspath(path)
+        with open(os.path.join(self._path, CHUNKED_META)) as file:
+            meta = json.load(file)
+        assert meta.get("order", "C") == "C"
+        compressor = meta.get("compressor")
+        self._compressor = None if compressor is None else compressor["id"]
+        assert self._compressor in CHUNKED_COMPRESSORS
+        self._shape = tuple(meta["shape"])
+        self._chunks = tuple(meta["chunks"])
+        self._dtype = np.dtype(meta["dtype"])
+        self._fill = meta.get("fill_value") or 0
+        self._separator = meta.get("dimension_separator", ".")
+
+    @property
+    def shape(self):
+        return self._shape
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def chunks(self):
+        return self._chunks
+
+    def _key(self):
+        return self._path
+
+    def _read_chunk(self, index):
+        name = self._separator.join(str(i) for i in index) or "0"
+        path = os.path.join(self._path, name)
+        if not os.path.exists(path):
+            chunk = np.full(self._chunks, self._fill, dtype=self._dtype)
+        else:
+            with open(path, "rb") as file:
+                raw = file.read()
+            if self._compressor == "zlib":
+                raw = zlib.decompress(raw)
+            chunk = np.frombuffer(raw, dtype=self._dtype).reshape(self._chunks)
+        # NOTE: edge chunks are stored at full size
+        return chunk[tuple(slice(0, min(c, s - i * c)) for i, c, s in zip(index, self._chunks, self._shape))]
+
+    def _read(self, region):
+        return _assemble(region, self._chunks, self._dtype, self._read_chunk)
+
+
+def save_chunked(
+    path: tp.Union[str, os.PathLike],
+    data: tp.NDArray,
+    chunks: tp.IntTuple,
+    compressor: tp.Optional[str] = None,
+    fill_value: tp.Any = 0,
+) -> ChunkedSource:
+    assert compressor in CHUNKED_COMPRESSORS
+    data = np.asarray(data)
+    chunks = tuple(int(c) for c in chunks)
+    assert len(chunks) == data.ndim
+    os.makedirs(path, exist_ok=True)
+    meta = dict(
+        zarr_format=2,
+        shape=list(data.shape),
+        chunks=list(chunks),
+        dtype=data.dtype.str,
+        fill_value=fill_value,
+        order="C",
+        compressor=None if compressor is None else dict(id=compressor),
+        filters=None,
+        dimension_separator=".",
+    )
+    with open(os.path.join(path, CHUNKED_META), "w") as file:
+        json.dump(meta, file)
+    ranges = [range(-(-s // c)) for s, c in zip(data.shape, chunks)]
+    for index in itertools.product(*ranges):
+        chunk = np.full(chunks, fill_value, dtype=data.dtype)
+        part = data[tuple(slice(i * c, (i + 1) * c) for i, c in zip(index, chunks))]
+        chunk[tuple(slice(0, n) for n in part.shape)] = part
+        raw = chunk.tobytes()
+        if compressor == "zlib":
+            raw = zlib.compress(raw)
+        with open(os.path.join(path, ".".join(str(i) for i in index) or "0"), "wb") as file:
+            file.write(raw)
+    return ChunkedSource(path)
+
+
+def as_source(data: tp.Any, cache: tp.Optional[LRUCache] = None) -> tp.Any:
+    # NOTE: in-memory arrays are returned as is, they are sampled directly
+    if isinstance(data, ArraySource):
+        return data
+    if _is_dataset(data):
+        return H5Source(data, cache=cache)
+    if isinstance(data, (str, os.PathLike)):
+        path = os.fspath(data)
+        if H5_SEPARATOR in path:
+            path, name = path.rsplit(H5_SEPARATOR, 1)
+            assert path.lower().endswith(H5_SUFFIXES)
+            return H5Source.open(path, name, cache=cache)
+        if os.path.isdir(path):
+            return ChunkedSource(path, cache=cache)
+        return MemmapSource(path, cache=cache)
+    return data
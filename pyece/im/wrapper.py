@@ -0,0 +1,171 @@
+__all__ = ("ByPatchWrapper",)
+
+import functools
+import itertools
+
+import numpy as np
+
+from ..core import typing as tp
+from ..core.cache import LRUCache
+from ..core.instrument import count
+from ..core.property import Corners
+from .blend import Stitcher
+from .executor import PatchExecutor, PatchReader, SequentialExecutor
+from .mesh import linspace
+from .patch import cutpatch
+from .source import as_source
+
+
+class _ResampleReader(PatchReader):
+    # NOTE: a task holds the data index of every patch voxel along each axis
+    def read(self, task: tp.Tuple[np.ndarray, ...]) -> np.ndarray:
+        lo = [int(i.min()) if len(i) else 0 for i in task]
+        hi = [int(i.max()) + 1 if len(i) else 0 for i in task]
+        window = np.asarray(self.data[tuple(slice(a, b) for a, b in zip(lo, hi))])
+        return window[np.ix_(*[i - a for i, a in zip(task, lo)])]
+
+
+class ByPatchWrapper:
+    def __init__(
+        self,
+        func: tp.Callable[[tp.NDArray], tp.NDArray],
+        size: tp.IntTuple,
+        spacing: tp.FloatTuple = None,
+        grid: tp.IntTuple = None,
+        executor: tp.Optional[PatchExecutor] = None,
+        lazy: bool = False,
+        cache: tp.Optional[LRUCache] = None,
+    ):
+        assert callable(func)
+        self._wrapper = func
+
+        self._dim = len(size)
+        self._size = np.asarray(size)
+
+        self._spacing = np.asarray(spacing or [1.0] * self._dim)
+        assert len(self._spacing) == self._dim
+
+        self._volume = self._size * self._spacing
+
+        assert (grid is None) or (len(grid) == self._dim)
+        self._grid = None
+        if grid is not None:
+            assert len(grid) == self._dim
+            self._grid = np.asarray(grid).astype(int)
+
+        self._executor = executor or SequentialExecutor()
+        # NOTE: lazy resampling cuts every patch from the data at its own
+        # spacing instead of resampling the whole volume up front
+        self._lazy = lazy
+        # NOTE: chunk cache for out-of-core inputs, see pyece.im.source
+        self._cache = cache
+
+    def _prepare(
+        self,
+        data: tp.NDArray,
+        spacing: tp.FloatTuple = None,
+        grid: tp.IntTuple = None,
+    ) -> tp.Tuple[PatchReader, np.ndarray, np.ndarray, tp.List[tp.Tuple[slice, ...]], tp.List[tp.Any]]:
+        data = as_source(data, cache=self._cache)
+        shape = np.asarray(data.shape[: self._dim])
+        spacing = np.asarray([1.0] * self._dim if spacing is None else spacing)
+        volume = shape * spacing
+        axes = None
+        # NOTE: resize data to required spacing
+        if not np.all(self._spacing == spacing):
+            resampled = np.round(volume / self._spacing).astype(int)
+            if self._lazy:
+                # NOTE: the product mesh of the eager resampling is separable,
+                # voxel j of the resampled volume reads these data indices
+                axes = [np.round(linspace(-0.5, n - 0.5, r)).astype(int) % n for n, r in zip(shape, resampled)]
+            else:
+                data = cutpatch(
+                    data=data,
+                    corners=Corners.product(shape).value - 0.5,
+                    grid=resampled,
+                )
+            shape = resampled
+            spacing = np.asarray(self._spacing)
+            volume = shape * spacing
+        if grid is None:
+            grid = self._grid if self._grid is not None else np.floor(volume / self._volume)
+        grid = np.asarray(grid, dtype="int")
+
+        ids = np.asarray(list(itertools.product(*map(range, grid)))).reshape(-1, self._dim)
+        # NOTE: a single patch along an axis stays at the origin
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = (self._volume + ((volume - (grid * self._volume)) / (grid - 1))) / self._spacing
+        step = np.where(grid > 1, step, 0)
+        shifts = np.round((ids * step)).astype(int)
+        slices = [tuple(slice(s, e, 1) for s, e in zip(shift, shift + self._size)) for shift in shifts]
+        if axes is None:
+            return PatchReader(data), shape, grid, slices, slices
+        # NOTE: patches past the upper edge are truncated like slices of the
+        # eagerly resampled volume
+        tasks = [tuple(a[s] for a, s in zip(axes, idx)) for idx in slices]
+        return _ResampleReader(data), shape, grid, slices, tasks
+
+    def _iterate(self, reader: PatchReader, grid: np.ndarray, slices, tasks, kwargs):
+        func = functools.partial(self._wrapper, **kwargs) if kwargs else self._wrapper
+        for i, wrapped_patch in self._executor.imap(func, reader, tasks):
+            grid_index = tuple(int(g) for g in np.unravel_index(i, grid))
+            count("im.patches")
+            yield grid_index, slices[i], wrapped_patch
+
+    def iterate(
+        self,
+        data: tp.NDArray,
+        spacing: tp.FloatTuple = None,
+        grid: tp.IntTuple = None,
+        **kwargs,
+    ) -> tp.Iterator[tp.Tuple[tp.Tuple[int, ...], tp.Tuple[slice, ...], tp.Any]]:
+        # NOTE: yields (grid_index, slices, result) in completion order, slices
+        # address the patch in the data at the wrapper spacing
+        reader, _, grid, slices, tasks = self._prepare(data, spacing, grid)
+        yield from self._iterate(reader, grid, slices, tasks, kwargs)
+
+    def __call__(
+        self,
+        data: tp.NDArray,
+        spacing: tp.FloatTuple = None,
+        grid: tp.IntTuple = None,
+        output: tp.Any = None,
+        **kwargs,
+    ) -> tp.Any:
+        # NOTE: output may be any (*grid, *tail) array supporting item assignment,
+        # e.g. np.memmap or h5py.Dataset, results are written as they complete;
+        # it is not named out to leave that keyword to func
+        reader, _, grid, slices, tasks = self._prepare(data, spacing, grid)
+
+        result = output
+        for grid_index, _, wrapped_patch in self._iterate(reader, grid, slices, tasks, kwargs):
+            if output is None:
+                wrapped_patch = np.asarray(wrapped_patch)
+                if result is None:
+                    result = np.empty((*grid, *wrapped_patch.shape), dtype=wrapped_patch.dtype)
+                # NOTE: promote like np.asarray over all results would
+                dtype = np.result_type(result.dtype, wrapped_patch.dtype)
+                if dtype != result.dtype:
+                    result = result.astype(dtype)
+            result[grid_index] = wrapped_patch
+        if result is None:
+            result = np.empty((*grid,))
+        return result
+
+    def stitch(
+        self,
+        data: tp.NDArray,
+        spacing: tp.FloatTuple = None,
+        grid: tp.IntTuple = None,
+        blend: str = "gaussian",
+        sigma: float = 0.125,
+        output: tp.Any = None,
+        **kwargs,
+    ) -> tp.Any:
+        # NOTE: func must map a patch to (*size, *tail), the result is the
+        # blended (*shape, *tail) volume at the wrapper spacing
+        reader, shape, grid, slices, tasks = self._prepare(data, spacing, grid)
+        stitcher = Stitcher(shape, self._size, blend=blend, sigma=sigma, out=output)
+        for _, idx, wrapped_patch in self._iterate(reader, grid, slices, tasks, kwargs):
+            stitcher.add(idx, wrapped_patch)
+        return stitcher.result()
@@ -36,7 +36,7 @@ setup(
     author_email=author_email,
     version=version,
     url="https://github.com/rilshok/pyece",
-    packages=find_packages(include=(name,)),
+    packages=find_packages(include=(name, f"{name}.*")),
     include_package_data=True,
     zip_safe=False,
     install_requires=requirements,
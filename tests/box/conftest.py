@@ -0,0 +1,16 @@
+import numpy as np
+from pytest import fixture
+from pyece.box import BoxArray
+
+
+def _random_boxes(seed, count, dim, anchor=(0, 20), side=(0, 8), canvas=30, integer=False):
+    rng = np.random.default_rng(seed)
+    draw = rng.integers if integer else rng.uniform
+    anchors = draw(anchor[0], anchor[1], (count, dim))
+    sides = draw(side[0], side[1], (count, dim))
+    return BoxArray(anchors, sides, [canvas] * dim)
+
+
+@fixture
+def random_boxes():
+    return _random_boxes
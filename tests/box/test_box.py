@@ -0,0 +1,39 @@
+import pytest
+from pyece.box import Box, Point, Size
+
+
+def test_point_size_values():
+    assert Point(1, 2) == (1.0, 2.0)
+    assert Point([1, 2]) == Point(1.0, 2.0)
+    assert hash(Point(1, 2)) == hash(Point(1.0, 2.0))
+    assert Size(3, 4) == [3, 4]
+    assert len({Size(3, 4), Size(3.0, 4.0)}) == 1
+    with pytest.raises(TypeError):
+        Point(1, 2)[0] = 3
+    with pytest.raises(TypeError):
+        Size(1, 2)[0] = 3
+
+
+def test_box_values():
+    canvas = (100, 50)
+    box = Box((1, 2), (10, -5), canvas)
+    assert box.anchor == (1, -3)
+    assert box.sides == (10, 5)
+    assert box.distant == (11, 2)
+    assert box == Box((1, -3), (10, 5), canvas)
+    assert len({box, Box((1, -3), (10, 5), canvas)}) == 1
+    assert box.area == 50
+    assert (5, 0) in box
+    with pytest.raises(AttributeError):
+        box.anchor = (0, 0)
+
+
+def test_box_split():
+    box = Box((0, 0), (10, 10), (20, 20))
+    parts = box.split((5, 5), (3, 8), (5, 30))
+    assert len(parts) == 9
+    assert parts[0] == Box((0, 0), (3, 5), (20, 20))
+    assert parts[-1] == Box((5, 8), (5, 2), (20, 20))
+    assert sum(part.area for part in parts) == box.area
+    assert box.split() == [box]
+    assert box.split((0, 10), (-1, 11)) == [box]
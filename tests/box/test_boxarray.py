@@ -0,0 +1,64 @@
+import numpy as np
+from pyece.box import Box, BoxArray, area_intersection, area_union
+
+
+def _boxes():
+    canvas = (100, 50)
+    return [
+        Box((1, 2), (10, -5), canvas),
+        Box((5, 0), (20, 20), canvas),
+        Box((30, 10), (5, 5), canvas),
+    ]
+
+
+def test_boxarray_roundtrip():
+    boxes = _boxes()
+    array = BoxArray.from_boxes(boxes)
+    assert array.data.shape == (3, 2, 2)
+    assert array.data.nbytes == 16 * 2 * len(boxes)
+    assert array.to_boxes() == boxes
+    assert array[1] == boxes[1]
+    assert len(array[1:]) == 2
+    assert array.canvas == boxes[0].canvas
+
+
+def test_boxarray_geometry():
+    boxes = _boxes()
+    array = BoxArray([b.anchor.coords for b in boxes], [b.sides.sides for b in boxes], (100, 50))
+    assert np.allclose(array.anchor, [b.anchor.numpy() for b in boxes])
+    assert np.allclose(array.distant, [b.distant.numpy() for b in boxes])
+    assert np.allclose(array.centre, [b.centre.numpy() for b in boxes])
+    assert np.allclose(array.area, [b.area for b in boxes])
+    point = (6, 1)
+    assert list(array.contains(point)) == [point in b for b in boxes]
+    assert array.contains([point, (0, 0)]).shape == (3, 2)
+
+
+def test_boxarray_negative_sides():
+    array = BoxArray([[10, 10]], [[-4, 2]], (20, 20))
+    assert np.allclose(array.anchor, [[6, 10]])
+    assert np.allclose(array.sides, [[4, 2]])
+
+
+def test_boxarray_canvas():
+    array = BoxArray([[1, 2]], [[3, 4]], (10, 10))
+    array.canvas = (20, 20)
+    assert np.allclose(array.anchor, [[2, 4]])
+    assert np.allclose(array.data[0], [[0.1, 0.2], [0.3, 0.4]])
+
+
+def test_boxarray_area():
+    boxes = _boxes()
+    array = BoxArray.from_boxes(boxes)
+    assert area_union(array) == area_union(*boxes)
+    assert area_intersection(array[:1], array[1:2]) == area_intersection(boxes[0], boxes[1])
+
+
+def test_boxarray_split():
+    boxes = _boxes()
+    array = BoxArray.from_boxes(boxes)
+    cuts = [(6, 1), (8, 4), (31, 12)]
+    parts = array.split(cuts)
+    assert parts.to_boxes() == [part for box in boxes for part in box.split(*cuts)]
+    assert np.isclose(parts.area.sum(), array.area.sum())
+    assert len(array.split()) == len(array)
@@ -0,0 +1,60 @@
+import numpy as np
+from pytest import mark
+from pyece.box import RTree, UniformGrid
+
+
+def _brute_points(bounds, alive, points):
+    inside = (bounds[None, :, 0] < points[:, None]) & (points[:, None] < bounds[None, :, 1])
+    return np.nonzero(inside.all(-1) & alive)
+
+
+def _brute_distance(bounds, alive, points):
+    gap = np.maximum(bounds[None, :, 0] - points[:, None], points[:, None] - bounds[None, :, 1])
+    distance = np.linalg.norm(np.maximum(gap, 0), axis=-1)
+    distance[:, ~alive] = np.inf
+    return np.sort(distance, axis=1)
+
+
+@mark.parametrize("index", [RTree, UniformGrid])
+@mark.parametrize("dim", [2, 3])
+def test_spatial_index(index, dim, random_boxes):
+    boxes = random_boxes(dim, 500, dim, anchor=(0, 100), side=(1, 10), canvas=100)
+    points = np.random.default_rng(0).uniform(-5, 105, (200, dim))
+    tree = index(boxes)
+    bounds = boxes.bounds
+    alive = np.ones(len(bounds), dtype=bool)
+
+    q, ids = tree.query_points(points)
+    expected = _brute_points(bounds, alive, points)
+    assert np.array_equal(q, expected[0]) and np.array_equal(ids, expected[1])
+
+    queries = random_boxes(dim + 1, 50, dim, anchor=(0, 100), side=(1, 10), canvas=100)
+    q, ids = tree.query_boxes(queries)
+    overlap = (queries.bounds[:, None, 0] < bounds[None, :, 1]) & (bounds[None, :, 0] < queries.bounds[:, None, 1])
+    expected = np.nonzero(overlap.all(-1))
+    assert np.array_equal(q, expected[0]) and np.array_equal(ids, expected[1])
+
+    _, distance = tree.nearest(points, k=3)
+    assert np.allclose(distance, _brute_distance(bounds, alive, points)[:, :3])
+
+
+@mark.parametrize("index", [RTree, UniformGrid])
+def test_spatial_index_edits(index, random_boxes):
+    boxes = random_boxes(0, 300, 2, anchor=(0, 100), side=(1, 10), canvas=100)
+    points = np.random.default_rng(1).uniform(0, 100, (100, 2))
+    tree = index(boxes)
+    tree.delete(np.arange(0, 300, 3))
+    new = tree.insert(random_boxes(1, 40, 2, anchor=(0, 100), side=(1, 10), canvas=100))
+    assert list(new) == list(range(300, 340))
+    tree.delete([301])
+    bounds = tree.bounds
+    alive = np.ones(len(bounds), dtype=bool)
+    alive[np.arange(0, 300, 3)] = False
+    alive[301] = False
+    assert len(tree) == alive.sum()
+
+    q, ids = tree.query_points(points)
+    expected = _brute_points(bounds, alive, points)
+    assert np.array_equal(q, expected[0]) and np.array_equal(ids, expected[1])
+    _, distance = tree.nearest(points, k=2)
+    assert np.allclose(distance, _brute_distance(bounds, alive, points)[:, :2])
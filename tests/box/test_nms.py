@@ -0,0 +1,41 @@
+import numpy as np
+from pytest import mark
+from pyece.box import nms, soft_nms, weighted_box_fusion
+
+
+def test_nms():
+    bounds = np.array([
+        [[0, 0], [10, 10]],
+        [[1, 1], [11, 11]],
+        [[20, 20], [30, 30]],
+    ])
+    assert list(nms(bounds, [0.9, 0.8, 0.7])) == [0, 2]
+    assert list(nms(bounds, [0.7, 0.8, 0.9])) == [2, 1]
+    assert list(nms(bounds, [0.9, 0.8, 0.7], threshold=0.9)) == [0, 1, 2]
+
+
+@mark.parametrize("dim", [2, 3])
+def test_nms_buckets(dim, random_boxes):
+    boxes = random_boxes(dim, 300, dim, anchor=(0, 100), side=(5, 20), canvas=100)
+    scores = np.random.default_rng(dim).uniform(0, 1, len(boxes))
+    assert np.array_equal(nms(boxes, scores), nms(boxes, scores, cell="auto"))
+    for method in ("gaussian", "linear"):
+        keep, kept_scores = soft_nms(boxes, scores, method=method)
+        bucket_keep, bucket_scores = soft_nms(boxes, scores, method=method, cell=15.0)
+        assert np.array_equal(keep, bucket_keep)
+        assert np.array_equal(kept_scores, bucket_scores)
+    fused, fused_scores = weighted_box_fusion(boxes, scores)
+    bucket_fused, bucket_scores = weighted_box_fusion(boxes, scores, cell="auto")
+    assert np.array_equal(fused, bucket_fused)
+    assert np.array_equal(fused_scores, bucket_scores)
+
+
+def test_weighted_box_fusion():
+    bounds = np.array([
+        [[0, 0], [10, 10]],
+        [[2, 2], [12, 12]],
+        [[50, 50], [60, 60]],
+    ])
+    fused, scores = weighted_box_fusion(bounds, [0.75, 0.25, 0.5], threshold=0.4)
+    assert np.allclose(fused, [[[0.5, 0.5], [10.5, 10.5]], [[50, 50], [60, 60]]])
+    assert np.allclose(scores, [0.5, 0.5])
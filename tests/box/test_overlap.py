@@ -0,0 +1,35 @@
+import numpy as np
+from pyece.box import (
+    Box,
+    area_intersection,
+    pairwise_giou,
+    pairwise_intersection,
+    pairwise_iou,
+)
+
+
+def test_pairwise_intersection(random_boxes):
+    a = random_boxes(0, 6, 3)
+    b = random_boxes(1, 4, 3)
+    inter = pairwise_intersection(a, b)
+    assert inter.shape == (6, 4)
+    for i, box1 in enumerate(a):
+        for j, box2 in enumerate(b):
+            assert np.isclose(inter[i, j], area_intersection(box1, box2))
+
+
+def test_pairwise_iou():
+    canvas = (10, 10)
+    a = [Box((0, 0), (2, 2), canvas)]
+    b = [Box((1, 0), (2, 2), canvas), Box((5, 5), (1, 1), canvas)]
+    assert np.allclose(pairwise_iou(a, b), [[2 / 6, 0]])
+    assert np.allclose(pairwise_giou(a, b), [[2 / 6, -(36 - 5) / 36]])
+    assert np.allclose(pairwise_iou(a, a), 1)
+
+
+def test_pairwise_tiles(random_boxes):
+    a = random_boxes(2, 50, 2)
+    b = random_boxes(3, 40, 2)
+    expected = pairwise_giou(a, b)
+    assert np.allclose(pairwise_giou(a, b.bounds, tile=7), expected)
+    assert np.allclose(pairwise_giou(a.bounds, b, tile=3, workers=4), expected)
@@ -0,0 +1,56 @@
+import numpy as np
+from pytest import mark
+from pyece.box import union
+from pyece.box import (
+    area_intersection,
+    area_union,
+    grid_union_area,
+    sweep_intersection_area,
+    sweep_union_area,
+)
+
+
+@mark.parametrize("dim", [1, 2, 3])
+@mark.parametrize("count", [1, 7, 25])
+def test_area_union_engines(dim, count, random_boxes):
+    boxes = random_boxes(count, count, dim, anchor=(0, 20), side=(-8, 9), canvas=40, integer=True)
+    expected = area_union(boxes, engine="split")
+    assert area_union(boxes) == expected
+    assert area_union(boxes, engine="grid") == expected
+    assert area_union(boxes, engine="sweep") == expected
+
+
+@mark.parametrize("dim", [1, 2, 3])
+def test_area_intersection_engines(dim, random_boxes):
+    boxes = random_boxes(dim, 12, dim, anchor=(0, 20), side=(-8, 9), canvas=40, integer=True)
+    groups = boxes[:6], boxes[6:]
+    expected = area_intersection(*groups, engine="split")
+    assert area_intersection(*groups) == expected
+    assert area_intersection(*groups, engine="grid") == expected
+    assert area_intersection(*groups, engine="sweep") == expected
+    for engine in ("auto", "grid", "sweep", "split"):
+        assert area_intersection(boxes[:6], [], engine=engine) == 0.0
+        assert area_intersection(boxes[:6], boxes[:0], engine=engine) == 0.0
+
+
+def test_area_auto_caps_grid(monkeypatch, random_boxes):
+    boxes = random_boxes(0, 40, 3, anchor=(0, 20), side=(-8, 9), canvas=40, integer=True)
+    expected = area_union(boxes, engine="grid"), area_intersection(boxes[:20], boxes[20:], engine="grid")
+    coverage = union._coverage
+
+    def flat_coverage(bounds, axes):
+        # NOTE: past the cap only the 1D base case of the sweep may build a grid
+        assert len(axes) == 1
+        return coverage(bounds, axes)
+
+    monkeypatch.setattr(union, "_coverage", flat_coverage)
+    monkeypatch.setattr("pyece.box.area.GRID_CELLS", 64)
+    assert (area_union(boxes), area_intersection(boxes[:20], boxes[20:])) == expected
+
+
+def test_union_area_arrays():
+    bounds = np.array([[[0, 0], [2, 2]], [[1, 1], [3, 3]], [[5, 5], [5, 9]]])
+    assert sweep_union_area(bounds) == 7
+    assert grid_union_area(bounds) == 7
+    assert sweep_union_area(np.zeros((0, 2, 2))) == 0
+    assert sweep_intersection_area(bounds[:1], bounds[1:]) == 1
@@ -0,0 +1,45 @@
+import numpy as np
+from pyece.core.math import (
+    ROTATION_CACHE,
+    apply_rotation,
+    axis_angle_matrix,
+    cached_rotate_matrix,
+    euler_matrix,
+    quaternion_matrix,
+)
+from pyece.core.math.rotate import rotate
+
+
+def test_rotation_constructors():
+    angles = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(16, 3))
+    matrices = euler_matrix(angles)
+    assert matrices.shape == (16, 3, 3)
+    assert np.allclose(matrices @ np.swapaxes(matrices, -1, -2), np.eye(3))
+    assert np.allclose(np.linalg.det(matrices), 1)
+
+    axes = np.eye(3)
+    for k, axis in enumerate(axes):
+        angle = np.zeros(3)
+        angle[k] = 0.7
+        assert np.allclose(axis_angle_matrix(axis, 0.7), euler_matrix(angle))
+    assert np.allclose(quaternion_matrix([2, 0, 0, 0]), np.eye(3))
+    assert axis_angle_matrix(np.ones((5, 3)), np.ones(5)).shape == (5, 3, 3)
+
+
+def test_apply_rotation():
+    points = np.random.default_rng(1).normal(size=(4, 10, 3))
+    angles = np.random.default_rng(2).normal(size=(4, 3))
+    pivot = np.array([1.0, 2.0, 3.0])
+    rotated = apply_rotation(euler_matrix(angles), points, pivot)
+    for b in range(4):
+        expected = [rotate(pivot, p, angles[b]) for p in points[b]]
+        assert np.allclose(rotated[b], expected)
+        assert np.allclose(apply_rotation(euler_matrix(angles[b]), points[b], pivot), expected)
+
+
+def test_cached_rotate_matrix():
+    quarter = cached_rotate_matrix((np.pi / 2,))
+    assert np.array_equal(quarter, [[0, -1], [1, 0]])
+    hits = ROTATION_CACHE.hits
+    assert cached_rotate_matrix((np.pi / 2 + 2 * np.pi,)) is quarter
+    assert ROTATION_CACHE.hits == hits + 1
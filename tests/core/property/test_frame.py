@@ -0,0 +1,39 @@
+import numpy as np
+from pyece.core.property import Convert, Corners, Frame, Point, PointShift, RandomUniform, Transformer
+
+
+def test_frame_memoizes_per_sample():
+    x = RandomUniform(0, 1, seed=0)
+    corners = Corners([[0, 0], [0, 1], Point([x, 0]), [1, 1]])
+    doubled = Convert(x, lambda v: 2 * v)
+    with Frame() as frame:
+        first = corners.value
+        assert np.array_equal(corners.value, first)
+        assert doubled.value == 2 * first[2, 0]
+        shifted = Transformer(PointShift((1, 1)))(corners).value
+        assert np.array_equal(shifted, first + 1)
+        assert x in frame
+    with Frame():
+        assert corners.value[2, 0] != first[2, 0]
+    assert x.value != x.value
+
+
+def test_frame_deep_graph():
+    node = RandomUniform(seed=1)
+    root = node
+    for _ in range(5000):
+        node = Convert(node, lambda v: v + 1)
+    with Frame() as frame:
+        assert node.value == root.value + 5000
+        assert len(frame) == 5001
+
+
+def test_frame_values_are_not_shared():
+    corners = Corners([[0, 0], [0, 1], Point([RandomUniform(0, 1, seed=2), 0]), [1, 1]])
+    shifted = Convert(corners, lambda v: v + 1)
+    with Frame():
+        value = corners.value
+        expected = value.copy()
+        value[0, 0] = 42
+        assert np.array_equal(corners.value, expected)
+        assert np.array_equal(shifted.value, expected + 1)
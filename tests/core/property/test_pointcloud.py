@@ -1,6 +1,19 @@
+import numpy as np
 from pytest import mark
 import pytest
 from pyece import Corners
+from pyece.core.math.rotation import ROTATION_CACHE
+from pyece.core.property import (
+    Iter,
+    Point,
+    PointCloud,
+    PointInflation,
+    PointOperation,
+    PointRotate,
+    PointShift,
+    RandomUniform,
+    Transformer,
+)
 
 
 @mark.parametrize(
@@ -27,3 +40,77 @@ def test_corners():
         Corners([[0, 0]]*8).value
     assert Corners([[0]*3]*8).value.shape == (8, 3)
     assert Corners([[0]*4]*16).value.shape == (16, 4)
+
+
+def test_pointcloud_transform():
+    points = np.random.default_rng(0).normal(size=(50, 3))
+    ops = [
+        PointRotate((0.1, 0.2, 0.3)),
+        PointShift((1, 2, 3)),
+        PointInflation(2.0, pivot=(1, 1, 1)),
+        PointRotate((0.5, 0, 1), pivot=(0, 0, 0)),
+    ]
+    cloud = Transformer(*ops)(PointCloud(points)).value
+    expected = points
+    for op in ops:
+        kwargs = dict(pivot=expected.mean(0)) if getattr(op, "_pivot", True) is None else dict()
+        fn = op(**kwargs)
+        expected = np.stack([fn(p).value for p in expected])
+    assert cloud.shape == (50, 3)
+    assert np.allclose(cloud, expected)
+
+    mixed = PointCloud([Point([RandomUniform(0, 1), 2.0]), (3.0, 4.0)])
+    assert mixed._points is None
+    assert mixed.transform(PointShift((1, 1))).value.shape == (2, 2)
+
+
+def test_pointcloud_nested():
+    constant = PointCloud([[0, 1], [2, 3], [4, 5]])
+    assert np.array_equal(PointCloud([constant, constant]).value, [constant.value] * 2)
+    evaluated = PointCloud([Point([RandomUniform(7, 7), 1]), (2, 3), (4, 5)])
+    assert np.array_equal(PointCloud([constant, evaluated]).value[1], [[7, 1], [2, 3], [4, 5]])
+
+
+def test_pointcloud_transform_chain_fallback():
+    class Square(PointOperation):
+        def operation(self, obj, **params):
+            return obj ** 2
+
+    points = np.random.default_rng(1).normal(size=(20, 2))
+    ops = [PointShift((1, 2)), PointRotate(0.7), Square(), PointInflation((2, 3)), PointRotate(0.3)]
+    expected = PointCloud(points)
+    for op in ops:
+        expected = expected.transform(op)
+    assert ops[1].matrix(2, **ops[1].params(pivot=(0, 0))).shape == (3, 3)
+    assert Square().matrix(2) is None
+    assert np.allclose(Transformer(*ops)(PointCloud(points)).value, expected.value)
+
+
+def test_transformer_sample():
+    corners = Corners.product((4, 6, 8))
+    angles = [(0.1, 0.2, 0.3), (1.0, 0.0, -0.5), (0.0, 2.0, 0.0)]
+    factors = [1.5, 0.5, 2.0]
+    batch = Transformer(
+        PointRotate(Iter(angles)),
+        PointInflation(Iter(factors), pivot=(1, 1, 1)),
+        PointShift((1.0, RandomUniform(2.0, 2.0), 3.0)),
+    ).sample(corners, 3)
+    assert batch.shape == (3, 8, 3)
+    for b, (angle, factor) in enumerate(zip(angles, factors)):
+        expected = Transformer(
+            PointRotate(angle),
+            PointInflation(factor, pivot=(1, 1, 1)),
+            PointShift((1.0, 2.0, 3.0)),
+        )(corners).value
+        assert np.allclose(batch[b], expected)
+    assert RandomUniform(0, (1, 2)).sample(5).shape == (5, 2)
+
+
+def test_rotate_cache():
+    corners = Corners.product((2, 3, 4))
+    ROTATION_CACHE.clear()
+    expected = Transformer(PointRotate((0.1, 0.2, 0.3)))(corners).value
+    assert (ROTATION_CACHE.hits, ROTATION_CACHE.misses) == (0, 0)
+    for _ in range(2):
+        assert np.allclose(Transformer(PointRotate((0.1, 0.2, 0.3), cache=True))(corners).value, expected)
+    assert (ROTATION_CACHE.hits, ROTATION_CACHE.misses) == (1, 1)
@@ -0,0 +1,38 @@
+import copy
+import pickle
+
+import numpy as np
+from pyece.core.property import Corners, PointShift, RandomChoice, RandomUniform, Transformer
+
+
+def test_random_seeded_streams():
+    a = RandomUniform(0, (1, 10), seed=7)
+    b = RandomUniform(0, (1, 10), seed=7, buffer=16)
+    values = [a.value for _ in range(40)]
+    assert np.array_equal(values, [b.value for _ in range(40)])
+    assert np.array_equal(RandomUniform(0, (1, 10), seed=7).sample(40), values)
+
+    workers = RandomChoice("abc", seed=3).spawn(4)
+    streams = ["".join(w.sample(32)) for w in workers]
+    assert len(set(streams)) == 4
+    assert streams == ["".join(w.sample(32)) for w in RandomChoice("abc", seed=3).spawn(4)]
+    a.reseed(7)
+    assert np.array_equal(a.value, values[0])
+
+
+def test_random_global_state():
+    np.random.seed(0)
+    first = RandomUniform().value
+    np.random.seed(0)
+    assert RandomUniform().value == first
+
+
+def test_random_pickle():
+    for prop in [RandomUniform(), RandomUniform(0, 1), RandomChoice("abc"), RandomChoice("abc", seed=1)]:
+        for clone in [pickle.loads(pickle.dumps(prop)), copy.deepcopy(prop)]:
+            assert type(clone) is type(prop)
+            assert np.shape(clone.value) == np.shape(prop.value)
+    transformer = Transformer(PointShift((RandomUniform(), RandomUniform(0, 1))))
+    assert pickle.loads(pickle.dumps(transformer))(Corners.product((2, 2))).value.shape == (4, 2)
+    seeded = RandomUniform(seed=5)
+    assert np.array_equal(pickle.loads(pickle.dumps(seeded)).sample(8), seeded.sample(8))
@@ -0,0 +1,24 @@
+import numpy as np
+from pyece.core.cache import LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.get_or_create("d", lambda: 4) == 4
+    assert len(cache) == 2
+
+
+def test_lru_cache_bytes():
+    cache = LRUCache(maxsize=10, maxbytes=100)
+    cache.put(0, np.zeros(8))
+    cache.put(1, np.zeros(8))
+    assert 0 not in cache and cache.nbytes == 64
+    cache.put(2, np.zeros(100))
+    assert 2 not in cache
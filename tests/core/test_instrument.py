@@ -0,0 +1,47 @@
+import numpy as np
+from pytest import raises
+from pyece.core import instrument
+from pyece.core.cache import LRUCache
+from pyece.core.property import Corners, PointShift, Transformer
+from pyece.im import ByPatchWrapper, MemmapSource, ThreadExecutor, cutpatch
+
+
+def test_instrument_sinks(tmp_path):
+    data = np.random.default_rng(0).normal(size=(64, 64)).astype(np.float32)
+    np.save(tmp_path / "data.npy", data)
+    source = MemmapSource(tmp_path / "data.npy", chunks=(16, 16), cache=LRUCache(64, name="chunks"))
+    wrapper = ByPatchWrapper(np.mean, (32, 32), spacing=(2.0, 2.0), lazy=True, executor=ThreadExecutor(2))
+    records = list()
+    assert not instrument.enabled()
+    with instrument.instrument() as sink, instrument.instrument(instrument.CallbackSink(lambda *r: records.append(r))):
+        assert instrument.enabled()
+        wrapper(source, spacing=(1.0, 1.0))
+        wrapper(source, spacing=(1.0, 1.0))
+        Transformer(PointShift((1, 1))).sample(Corners.product((2, 2)), 8)
+    assert not instrument.enabled()
+
+    summary = sink.summary()
+    assert summary["counters"]["im.patches"] == 2
+    assert summary["counters"]["im.bytes_read"] == data.nbytes
+    assert summary["counters"]["property.samples"] == 8
+    assert sink.hit_rate("chunks") == 0.5
+    for stage in ["im.patch.read", "im.patch.func", "property.sample"]:
+        assert summary["timings"][stage]["calls"] > 0
+    assert {kind for kind, _, _ in records} == {"timing", "count"}
+
+    with instrument.instrument() as sink:
+        cutpatch(source, Corners.product((8, 8)).value - 0.5, (4, 4))
+        cutpatch(data, Corners.product((8, 8)).value - 0.5, (4, 4))
+    assert sink.hit_rate("mesh") is not None
+    for stage in ["im.cutpatch", "im.meshcorners", "im.gather", "im.read_window"]:
+        assert sink.summary()["timings"][stage]["calls"] > 0
+
+
+def test_sink_is_abstract():
+    with raises(TypeError):
+        instrument.Sink()
+    sink = instrument.CounterSink()
+    sink.record("timing", "stage", 0.5)
+    sink.record("timing", "stage", 1.5)
+    assert sink.timings["stage"] == (2, 2.0)
+    assert sink.hit_rate("missing") is None
@@ -0,0 +1,54 @@
+import numpy as np
+from pytest import mark
+from pyece import Corners
+from pyece.im import MESH_CACHE, linspace, meshcorners, meshcorners_batch
+
+
+def _reference(corners, grid):
+    c = len(corners) // 2
+    if c == 0:
+        return corners[0]
+    return linspace(
+        start=_reference(corners[:c], grid[1:]),
+        end=_reference(corners[c:], grid[1:]),
+        count=grid[0],
+    )
+
+
+@mark.parametrize("grid", [(5,), (7, 9), (4, 5, 6), (2, 3, 4, 5)])
+def test_meshcorners(grid):
+    corners = np.random.default_rng(len(grid)).uniform(-50, 50, (2 ** len(grid), len(grid)))
+    mesh = meshcorners(corners, grid)
+    assert mesh.shape == (*grid, len(grid))
+    assert np.array_equal(mesh, _reference(corners, grid))
+
+
+@mark.parametrize("dim", [2, 3])
+def test_meshcorners_half_pixel(dim):
+    # NOTE: half-pixel samples sit exactly on rounding ties, any ulp of error
+    # flips them to the other neighbour
+    rng = np.random.default_rng(dim)
+    for _ in range(50):
+        corners = Corners.product(rng.integers(1, 40, dim)).value + rng.integers(-5, 5, dim) - 0.5
+        grid = tuple(rng.integers(1, 20, dim))
+        expected = _reference(corners, grid).round()
+        assert np.array_equal(meshcorners(corners, grid).round(), expected)
+        batch = meshcorners_batch(np.stack([corners, corners + 1]), grid).round()
+        assert np.array_equal(batch, [expected, _reference(corners + 1, grid).round()])
+
+
+def test_meshcorners_cache():
+    MESH_CACHE.clear()
+    corners = Corners.product((8, 8, 8)).value
+    first = meshcorners(corners, (4, 4, 4))
+    second = meshcorners(corners * 2, np.array([4, 4, 4]))
+    assert np.allclose(second, first * 2)
+    assert (MESH_CACHE.hits, MESH_CACHE.misses) == (1, 1)
+
+
+def test_meshcorners_batch():
+    corners = np.random.default_rng(0).uniform(-5, 5, (3, 8, 3))
+    mesh = meshcorners_batch(corners, (4, 5, 6))
+    assert mesh.shape == (3, 4, 5, 6, 3)
+    for c, m in zip(corners, mesh):
+        assert np.array_equal(m, meshcorners(c, (4, 5, 6)))
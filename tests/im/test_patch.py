@@ -0,0 +1,56 @@
+import h5py
+import numpy as np
+from pytest import mark
+from pyece import Corners
+from pyece.im import cutpatch, cutpatches, meshcorners
+
+
+@mark.parametrize("shift", [(10, 20, 30), (-20, -5, 0), (150, 170, 150)])
+@mark.parametrize("fill", [None, 0])
+@mark.parametrize("chunked", [False, True])
+def test_cutpatch_h5_window(tmp_path, shift, fill, chunked):
+    data = np.random.default_rng(0).normal(size=(160, 180, 170, 2)).astype(np.float32)
+    with h5py.File(tmp_path / "data.h5", "w") as file:
+        dataset = file.create_dataset("data", data=data, chunks=(32, 32, 32, 2))
+        corners = Corners.product((40, 40, 40)).value + shift
+        expected = cutpatch(data, corners, (16, 16, 16), fill=fill)
+        patch = cutpatch(dataset, corners, (16, 16, 16), fill=fill, chunked=chunked)
+    assert patch.shape == (16, 16, 16, 2)
+    assert np.array_equal(patch, expected)
+
+
+@mark.parametrize("order", [1, 3])
+def test_cutpatch_interpolation(order):
+    x, y = np.meshgrid(np.arange(50), np.arange(60), indexing="ij")
+    data = (2 * x + 3 * y).astype(float)
+    corners = Corners.product((20, 20)).value + (10.3, 15.1)
+    patch = cutpatch(data, corners, (7, 9), order=order)
+    mesh = np.moveaxis(meshcorners(corners, (7, 9)), -1, 0)
+    assert np.allclose(patch, 2 * mesh[0] + 3 * mesh[1])
+
+
+@mark.parametrize("order", [0, 1, 3])
+def test_cutpatch_interpolation_fill(tmp_path, order):
+    data = np.random.default_rng(1).normal(size=(30, 40, 3))
+    corners = Corners.product((20, 20)).value - (5.5, 2.2)
+    patch = cutpatch(data, corners, (8, 8), fill=0, order=order)
+    assert patch.shape == (8, 8, 3)
+    assert (patch[0] == 0).all()
+    assert not np.array_equal(patch, cutpatch(data, corners, (8, 8), order=order))
+    with h5py.File(tmp_path / "data.h5", "w") as file:
+        dataset = file.create_dataset("data", data=data)
+        assert np.allclose(patch, cutpatch(dataset, corners, (8, 8), fill=0, order=order))
+
+
+@mark.parametrize("order", [0, 1])
+def test_cutpatches(tmp_path, order):
+    rng = np.random.default_rng(2)
+    data = rng.normal(size=(40, 50, 30))
+    corners = Corners.product((12, 12, 12)).value + rng.uniform(-10, 40, (16, 1, 3))
+    expected = np.stack([cutpatch(data, c, (6, 5, 4), fill=-1, order=order) for c in corners])
+    patches = cutpatches(data, corners, (6, 5, 4), fill=-1, order=order)
+    assert patches.shape == (16, 6, 5, 4)
+    assert np.allclose(patches, expected)
+    with h5py.File(tmp_path / "data.h5", "w") as file:
+        dataset = file.create_dataset("data", data=data)
+        assert np.allclose(cutpatches(dataset, corners, (6, 5, 4), fill=-1, order=order), expected)
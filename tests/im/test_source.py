@@ -0,0 +1,92 @@
+import pickle
+
+import h5py
+import numpy as np
+from pytest import mark
+from pyece import Corners
+from pyece.core.cache import LRUCache
+from pyece.im import (
+    ByPatchWrapper,
+    H5Source,
+    MemmapSource,
+    ProcessExecutor,
+    as_source,
+    cutpatch,
+    save_chunked,
+)
+
+
+def _sources(tmp_path, data):
+    np.save(tmp_path / "data.npy", data)
+    data.tofile(tmp_path / "data.raw")
+    file = h5py.File(tmp_path / "data.h5", "w")
+    file.create_dataset("data", data=data, chunks=(16, 16, 1))
+    yield as_source(str(tmp_path / "data.npy"))
+    yield MemmapSource(tmp_path / "data.raw", dtype=data.dtype, shape=data.shape, chunks=(8, 8, 2), cache=LRUCache(8))
+    yield H5Source(file["data"], cache=LRUCache(64))
+    yield as_source(f"{tmp_path / 'data.h5'}::data")
+    yield save_chunked(tmp_path / "data.zarr", data, (13, 17, 2))
+    save_chunked(tmp_path / "zlib.zarr", data, (20, 9, 1), compressor="zlib")
+    yield as_source(str(tmp_path / "zlib.zarr"), cache=LRUCache(4))
+    file.close()
+
+
+def test_source_read_region(tmp_path):
+    data = np.random.default_rng(0).normal(size=(50, 40, 2)).astype(np.float32)
+    for source in _sources(tmp_path, data):
+        assert source.shape == data.shape and source.dtype == data.dtype
+        for index in [(slice(3, 31), slice(7, 40)), (5, slice(None), 1), (Ellipsis, 0), (slice(10, 10),)]:
+            # NOTE: the second read is served from the chunk cache if any
+            assert np.array_equal(source[index], data[index])
+            assert np.array_equal(source[index], data[index])
+        assert np.array_equal(np.asarray(source), data)
+
+
+@mark.parametrize("order", [0, 1])
+def test_source_cutpatch(tmp_path, order):
+    data = np.random.default_rng(1).normal(size=(50, 40, 2)).astype(np.float32)
+    corners = Corners.product((30, 30)).value + (35, -4)
+    expected = cutpatch(data, corners, (12, 10), order=order, fill=0)
+    for source in _sources(tmp_path, data):
+        patch = cutpatch(source, corners, (12, 10), order=order, fill=0, chunked=True)
+        assert np.array_equal(patch, expected)
+        if source.cache is not None:
+            assert source.cache.misses > 0
+
+
+def test_source_wrapper(tmp_path):
+    data = np.random.default_rng(2).normal(size=(64, 48)).astype(np.float32)
+    source = save_chunked(tmp_path / "data.zarr", data, (16, 16))
+    expected = ByPatchWrapper(np.mean, (16, 16))(data)
+    wrapper = ByPatchWrapper(np.mean, (16, 16), executor=ProcessExecutor(workers=2), cache=LRUCache(16))
+    assert np.array_equal(wrapper(source), expected)
+    assert np.array_equal(wrapper(str(tmp_path / "data.zarr")), expected)
+
+
+def test_source_memmap_executor(tmp_path):
+    data = np.random.default_rng(3).normal(size=(64, 48)).astype(np.float32)
+    expected = ByPatchWrapper(np.mean, (16, 16))(data)
+    with open(tmp_path / "data.raw", "wb") as file:
+        file.write(b"header")
+        data.tofile(file)
+    volume = np.memmap(tmp_path / "data.raw", dtype=data.dtype, mode="r", shape=data.shape, offset=6)
+    source = MemmapSource.from_memmap(volume)
+    # NOTE: workers reopen the file, the volume itself is never pickled
+    assert len(pickle.dumps(source)) < 1024
+    assert np.array_equal(source[...], data)
+    wrapper = ByPatchWrapper(np.mean, (16, 16), executor=ProcessExecutor(workers=2))
+    assert np.array_equal(wrapper(volume), expected)
+    # NOTE: a view is not described by its file, it goes through shared memory
+    assert np.array_equal(wrapper(volume[16:]), expected[1:])
+
+
+def test_source_h5_close(tmp_path):
+    with h5py.File(tmp_path / "data.h5", "w") as file:
+        file.create_dataset("data", data=np.arange(12.0).reshape(3, 4))
+    source = H5Source.open(tmp_path / "data.h5", "data")
+    copy = pickle.loads(pickle.dumps(source))
+    with copy:
+        assert np.array_equal(copy[1], [4, 5, 6, 7])
+    assert not copy._dataset.id.valid
+    source.close()
+    assert not source._dataset.id.valid
@@ -0,0 +1,133 @@
+import h5py
+import numpy as np
+from pytest import mark, raises
+from pyece.im import (
+    BatchExecutor,
+    ByPatchWrapper,
+    ProcessExecutor,
+    SequentialExecutor,
+    ThreadExecutor,
+    blend_weights,
+)
+
+
+def _stats(patch, scale=1.0):
+    return np.stack([patch.mean(axis=(-2, -1)), patch.max(axis=(-2, -1))], axis=-1) * scale
+
+
+@mark.parametrize(
+    "executor",
+    [
+        ThreadExecutor(workers=3, inflight=2),
+        ProcessExecutor(workers=2),
+        BatchExecutor(4),
+        BatchExecutor(3, ThreadExecutor(workers=2)),
+    ],
+)
+def test_wrapper_executors(executor):
+    data = np.random.default_rng(0).normal(size=(70, 90))
+    expected = ByPatchWrapper(_stats, (20, 30), executor=SequentialExecutor())(data, scale=2.0)
+    result = ByPatchWrapper(_stats, (20, 30), executor=executor)(data, scale=2.0)
+    assert expected.shape == (3, 3, 2)
+    assert np.array_equal(result, expected)
+
+
+def test_wrapper_single_patch_grid():
+    data = np.arange(100.0).reshape(10, 10)
+    result = ByPatchWrapper(lambda patch: patch.sum(), (10, 4), grid=(1, 2))(data)
+    assert np.array_equal(result, [[data[:, :4].sum(), data[:, 6:].sum()]])
+
+
+def test_wrapper_result_promotion():
+    data = np.arange(100).reshape(10, 10)
+    wrapper = ByPatchWrapper(lambda patch: patch[0, 0] if patch[0, 0] == 0 else patch[0, 0] + 0.5, (5, 5))
+    result = wrapper(data)
+    assert result.dtype == np.float64
+    assert np.array_equal(result, [[0, 5.5], [50.5, 55.5]])
+
+
+@mark.parametrize("blend", ["constant", "linear", "gaussian"])
+def test_wrapper_stitch(blend):
+    data = np.random.default_rng(1).normal(size=(50, 64))
+    wrapper = ByPatchWrapper(lambda patch, k: np.stack([patch, k * patch], axis=-1), (16, 20))
+    result = wrapper.stitch(data, grid=(4, 5), blend=blend, k=3.0)
+    assert result.shape == (50, 64, 2)
+    assert np.allclose(result[..., 0], data)
+    assert np.allclose(result[..., 1], 3 * data)
+
+
+def test_blend_weights():
+    weights = blend_weights((5, 4), "linear")
+    assert weights.shape == (5, 4)
+    assert weights.max() == 1 and weights.min() > 0
+    assert np.allclose(weights, weights[::-1, ::-1])
+
+
+def test_wrapper_iterate_and_out(tmp_path):
+    data = np.random.default_rng(2).normal(size=(40, 60))
+    wrapper = ByPatchWrapper(_stats, (20, 20), executor=ThreadExecutor(workers=2))
+    expected = wrapper(data)
+    seen = dict()
+    for grid_index, idx, result in wrapper.iterate(data):
+        assert np.array_equal(result, _stats(data[idx]))
+        seen[grid_index] = result
+    assert sorted(seen) == [(i, j) for i in range(2) for j in range(3)]
+
+    with h5py.File(tmp_path / "out.h5", "w") as file:
+        out = file.create_dataset("out", shape=expected.shape, dtype=expected.dtype)
+        assert wrapper(data, output=out) is out
+        assert np.array_equal(out[...], expected)
+
+    volume = np.lib.format.open_memmap(tmp_path / "volume.npy", mode="w+", dtype=float, shape=(40, 60))
+    volume[...] = np.nan
+    wrapper = ByPatchWrapper(lambda patch: 2 * patch, (20, 25), grid=(3, 3))
+    assert wrapper.stitch(data, blend="linear", output=volume) is volume
+    assert np.allclose(volume, 2 * data)
+
+    # NOTE: out is forwarded to func like any other keyword
+    wrapper = ByPatchWrapper(np.negative, (20, 25), grid=(3, 3))
+    target = np.empty((20, 25))
+    assert np.allclose(wrapper.stitch(data, out=target), -data)
+
+    with raises(AssertionError):
+        wrapper.stitch(data, output=np.zeros((40, 60), dtype=int))
+
+
+def test_stitcher_slabs(monkeypatch):
+    data = np.random.default_rng(4).normal(size=(45, 38, 2))
+    wrapper = ByPatchWrapper(lambda patch: patch, (16, 15), grid=(4, 3))
+    expected = wrapper.stitch(data)
+    # NOTE: one row per slab, the weight sum is rebuilt from placements per row
+    monkeypatch.setattr("pyece.im.blend._slabs", lambda shape, nbytes: (slice(i, i + 1) for i in range(shape[0])))
+    assert np.allclose(wrapper.stitch(data), expected)
+    assert np.allclose(expected, data)
+
+
+@mark.parametrize("executor", [SequentialExecutor(), ProcessExecutor(workers=2)])
+def test_wrapper_lazy_resampling(executor):
+    data = np.random.default_rng(3).normal(size=(61, 47))
+    eager = ByPatchWrapper(_stats, (16, 12), spacing=(1.5, 0.75))
+    lazy = ByPatchWrapper(_stats, (16, 12), spacing=(1.5, 0.75), executor=executor, lazy=True)
+    expected = eager(data, spacing=(1.0, 1.0))
+    assert expected.shape == (2, 5, 2)
+    assert np.array_equal(lazy(data, spacing=(1.0, 1.0)), expected)
+
+    eager = ByPatchWrapper(lambda patch: patch, (16, 12), spacing=(1.5, 0.75), grid=(3, 6))
+    lazy = ByPatchWrapper(lambda patch: patch, (16, 12), spacing=(1.5, 0.75), grid=(3, 6), lazy=True)
+    assert np.array_equal(lazy.stitch(data, spacing=(1.0, 1.0)), eager.stitch(data, spacing=(1.0, 1.0)))
+
+
+@mark.parametrize("spacing", [(2.0, 2.0), (0.5, 0.75), (3.0, 1.5), (0.75, 2.0)])
+@mark.parametrize("size", [(8, 8), (5, 11), (16, 3)])
+@mark.parametrize("grid", [None, (3, 4)])
+def test_wrapper_lazy_matches_eager(spacing, size, grid):
+    data = np.random.default_rng(5).normal(size=(30, 37, 2))
+    eager = ByPatchWrapper(lambda patch: patch, size, spacing=spacing, grid=grid)
+    lazy = ByPatchWrapper(lambda patch: patch, size, spacing=spacing, grid=grid, lazy=True)
+    expected = {index: (idx, patch) for index, idx, patch in eager.iterate(data)}
+    result = {index: (idx, patch) for index, idx, patch in lazy.iterate(data)}
+    assert expected.keys() == result.keys()
+    for index, (idx, patch) in expected.items():
+        # NOTE: edge patches may be truncated, both modes must agree on it
+        assert result[index][0] == idx
+        assert np.array_equal(result[index][1], patch)
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+# NOTE: generous bound on the cumulative import time of pyece itself, numpy
+# excluded, catches heavy imports sneaking back in rather than small drifts
+IMPORT_BUDGET_US = 300_000
+
+
+def _importtime(code: str):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = dict()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        if cumulative.isdigit():
+            times[name] = int(cumulative)
+    return proc.stdout, times
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, pyece, pyece.im, pyece.box; "
+        "print(sorted(m for m in ('h5py', 'nptyping') if m in sys.modules))"
+    )
+    stdout, _ = _importtime(code)
+    assert stdout.strip() == "[]"
+    stdout, _ = _importtime("import sys, pyece; pyece.im; print('pyece.im' in sys.modules)")
+    assert stdout.strip() == "True"
+
+
+def test_import_time():
+    _, times = _importtime("import numpy; import pyece, pyece.im, pyece.box")
+    total = sum(t for name, t in times.items() if name in ("pyece", "pyece.im", "pyece.box"))
+    assert total < IMPORT_BUDGET_US, times